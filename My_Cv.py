@@ -1,34 +1,274 @@
 import streamlit as st
+import argparse
+import asyncio
 import base64
+import csv
+import gzip
+import io
+import hashlib
+import hmac
+import json
 import os
+import random
+import re
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from html import escape, unescape
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import analytics
+import contact
+import demo_health
 
 # ---------------------------
-# PAGE CONFIG
+# SETTINGS
 # ---------------------------
-st.set_page_config(
-    page_title="Raja Roy | AI & Data Science Portfolio",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PAGE_TITLE = "Raja Roy | AI & Data Science Portfolio"
+PAGE_ICON = "🚀"
+
+# Total bytes the shared asset cache may hold before evicting old entries.
+ASSET_CACHE_MAX_BYTES = int(os.environ.get("ASSET_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+
+# Files sent to the browser are published to ASSETS_DIR under content-hashed
+# names and listed in its manifest.json (see AssetManifest). Run through
+# serve.py, they are served from /assets/ with immutable caching headers and
+# precompressed copies; under `streamlit run My_Cv.py` they come from
+# Streamlit's static serving (see .streamlit/config.toml).
+STATIC_DIR = os.path.join(APP_DIR, "static")
+ASSETS_DIR = os.path.join(STATIC_DIR, "assets")
+ASSET_ROUTE = os.environ.get("ASSET_ROUTE", "0") == "1"  # set by serve.py
+ASSETS_URL = "assets" if ASSET_ROUTE else "app/static/assets"
+# Text-like assets also get .gz/.br copies when these are at least 10% smaller.
+PRECOMPRESS_EXTENSIONS = (".css", ".svg", ".pdf", ".js", ".json", ".txt")
+PRECOMPRESS_MIN_SAVING = 0.10
+
+# Self-hosted Poppins: subsetted WOFF2 faces built into static/fonts by
+# `python My_Cv.py fonts --source DIR` from the upstream TTFs. Without them
+# the stylesheet falls back to the Google Fonts import.
+FONTS_DIR = os.path.join(STATIC_DIR, "fonts")
+POPPINS_SOURCES = {
+    300: "Poppins-Light.ttf",
+    400: "Poppins-Regular.ttf",
+    500: "Poppins-Medium.ttf",
+    600: "Poppins-SemiBold.ttf",
+    700: "Poppins-Bold.ttf",
+    800: "Poppins-ExtraBold.ttf",
+    900: "Poppins-Black.ttf",
+}
+# Faces used above the fold (body, headings, bold) are preloaded.
+PRELOAD_FONT_WEIGHTS = (400, 600, 700)
+GOOGLE_FONTS_IMPORT = (
+    "@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;600;700;800;900&display=swap');"
 )
 
+# "client" ships both palettes and switches theme in the browser without a
+# rerun; "server" keeps the sidebar radio and one stylesheet per theme.
+THEME_MODE = os.environ.get("THEME_MODE", "client")
+
+# CSS sources compiled into one cached stylesheet bundle per theme. A source
+# may be scoped to a selector, e.g. dark overrides under <html data-theme>.
+STYLES_DIR = os.path.join(APP_DIR, "styles")
+DARK_SCOPE = ':root[data-theme="dark"]'
+STYLE_SOURCES = {
+    "light": (("portfolio.css", None),),
+    "dark": (("portfolio.css", None), ("portfolio-dark.css", None)),
+    "client": (("portfolio.css", None), ("portfolio-dark.css", DARK_SCOPE)),
+    "export": (("portfolio.css", None), ("portfolio-dark.css", DARK_SCOPE), ("export.css", None)),
+}
+
+# Structured CV content (see CONTENT_SCHEMA) rendered by the page.
+CONTENT_FILE = os.environ.get("CONTENT_FILE", "cv_content.json")
+
+# Page languages. CONTENT_FILE holds the English content; each other locale
+# overlays the keys translated in LOCALES_DIR/<code>.json, and anything not
+# translated falls back to English.
+LOCALES = {"en": "English", "it": "Italiano", "hi": "हिन्दी"}
+DEFAULT_LOCALE = "en"
+LOCALES_DIR = "locales"
+# Core PDF fonts only cover Latin scripts; other locales get the English CV.
+CV_PDF_LOCALES = ("en", "it")
+
+# Rendered section fragments kept in the shared LRU fragment cache.
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.environ.get("FRAGMENT_CACHE_MAX_ENTRIES", 1024))
+
+# More portfolios served by this process, chosen with ?profile=<name>. Each
+# lives in PROFILES_DIR/<name>/ with its own CONTENT_FILE, photo, CV and
+# locales; without the parameter the app directory's own content is shown.
+# Cached assets and fragments of all profiles together are kept under
+# PROFILE_MEMORY_BUDGET by dropping those of the least recently visited.
+PROFILES_DIR = os.path.join(APP_DIR, os.environ.get("PROFILES_DIR", "profiles"))
+PROFILE_MEMORY_BUDGET = int(os.environ.get("PROFILE_MEMORY_BUDGET", 16 * 1024 * 1024))
+
+# Lazy tabs run only the selected tab (and ones already visited this session).
+LAZY_TABS = os.environ.get("LAZY_TABS", "1") != "0"
+
+# Record size and render time of every emitted element and show them in a
+# debug panel. Also enabled per visit with ?debug=payload&token=<DEBUG_TOKEN>;
+# while DEBUG_TOKEN is unset the query parameters do nothing.
+PAYLOAD_DEBUG = os.environ.get("PAYLOAD_DEBUG", "0") == "1"
+DEBUG_TOKEN = os.environ.get("DEBUG_TOKEN", "")
+
+# Visitor analytics (see analytics.py): page views and tab changes are queued
+# by the script, CV downloads and demo clicks arrive as <a ping> beacons on
+# serve.py's /events/ route (or from the deferred download button). The
+# dashboard is opt-in: ANALYTICS_DASHBOARD=1, or per visit with
+# ?debug=analytics&token=<DEBUG_TOKEN>. It shows the visited profile only.
+ANALYTICS = os.environ.get("ANALYTICS", "1") != "0"
+ANALYTICS_DASHBOARD = os.environ.get("ANALYTICS_DASHBOARD", "0") == "1"
+
+# "static" serves the profile photo by URL; "base64" inlines it as a data URI.
+PHOTO_DELIVERY = os.environ.get("PHOTO_DELIVERY", "static")
+
+# The photo is served as resized, metadata-free variants built into
+# PHOTO_BUILD_DIR: every PHOTO_FORMATS at the avatar's CSS sizes (desktop,
+# then mobile; see .profile-img) at 1x and 2x density.
+PHOTO_BUILD_DIR = os.path.join(APP_DIR, "build", "images")
+PHOTO_DISPLAY_PX = (170, 130)
+PHOTO_SIZES = "(max-width: 768px) 130px, 170px"
+PHOTO_FORMATS = ("avif", "webp", "png")  # preferred first; PNG is the <img> fallback
+PHOTO_VARIANT_LAYOUT = 2  # bump when build_photo_variants changes to rebuild variants
+
+# Minify rendered sections and lift inline styles repeated at least
+# LIFT_STYLE_MIN_USES times into generated classes (see MarkupOptimizer).
+HTML_OPTIMIZE = os.environ.get("HTML_OPTIMIZE", "1") != "0"
+LIFT_STYLE_MIN_USES = 2
+
+# "static" links the CV at its published static URL (one copy on disk for
+# every session); "deferred" uses a download button that reads the PDF only
+# when clicked. Without static serving "static" falls back to "deferred".
+CV_DELIVERY = os.environ.get("CV_DELIVERY", "static")
+
+# "generated" renders the CV PDF from CONTENT_FILE (needs fpdf2) into
+# CV_BUILD_DIR, keyed by content hash; "file" serves the committed profile.cv.
+# The committed file is also served while a build runs or if it fails.
+CV_SOURCE = os.environ.get("CV_SOURCE", "generated")
+CV_BUILD_DIR = os.path.join(APP_DIR, "build", "cv")
+CV_PDF_LAYOUT = 1  # bump when render_cv_pdf changes to rebuild cached PDFs
+
+# In-page fraud demo: a joblib model file, or "" to train one on synthetic
+# data. Uploaded CSVs are scored FRAUD_SCORE_CHUNK_ROWS rows at a time.
+FRAUD_MODEL_FILE = os.environ.get("FRAUD_MODEL_FILE", "")
+FRAUD_SCORE_CHUNK_ROWS = int(os.environ.get("FRAUD_SCORE_CHUNK_ROWS", 50_000))
+FRAUD_THRESHOLD = 0.5
+FRAUD_TOP_ROWS = 100  # highest-scoring rows kept and shown per upload
+FRAUD_SAMPLE_ROWS = 20_000
+
+# Featured-project demo links are probed in the background and shown with
+# an up/sleeping/down badge (see demo_health.py).
+DEMO_HEALTH = os.environ.get("DEMO_HEALTH", "1") != "0"
+
+# Contact form submissions are queued and delivered in the background to
+# CONTACT_BACKEND (see contact.py). Messages go to CONTACT_TO, or the
+# profile's footer email.
+CONTACT_TO = os.environ.get("CONTACT_TO", "")
+CONTACT_MIN_INTERVAL = 60  # seconds between two submissions of one session
+
 # ---------------------------
 # HELPERS
 # ---------------------------
+class AssetCache:
+    """Thread-safe LRU cache of file bytes shared by every session.
+
+    Entries are keyed on the resolved path and validated against the file's
+    mtime and size, so an edited file is re-read on its next request. The
+    total size of cached bytes is kept under ``max_bytes`` by evicting the
+    least recently used entries.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> (mtime_ns, size, data)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str):
+        """Return the bytes of ``path``, reading from disk only when stale."""
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old:
+                self.current_bytes -= len(old[2])
+            if len(data) <= self.max_bytes:
+                self._entries[path] = (stat.st_mtime_ns, stat.st_size, data)
+                self.current_bytes += len(data)
+                while self.current_bytes > self.max_bytes:
+                    _, (_, _, evicted) = self._entries.popitem(last=False)
+                    self.current_bytes -= len(evicted)
+                    self.evictions += 1
+        return data
+
+    def resident(self, owns) -> int:
+        """Bytes cached for the paths ``owns(path)`` accepts."""
+        with self._lock:
+            return sum(len(entry[2]) for path, entry in self._entries.items() if owns(path))
+
+    def evict(self, owns) -> int:
+        """Drop the entries whose path ``owns`` accepts; returns bytes freed."""
+        with self._lock:
+            paths = [path for path in self._entries if owns(path)]
+            freed = sum(len(self._entries.pop(path)[2]) for path in paths)
+            self.current_bytes -= freed
+            self.evictions += len(paths)
+            return freed
+
+    def stats(self) -> dict:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+@st.cache_resource
+def get_asset_cache() -> AssetCache:
+    """One asset cache per process, shared across sessions and reruns."""
+    return AssetCache(ASSET_CACHE_MAX_BYTES)
+
+
+def find_app_file(filename: str):
+    """Resolve a file from the app directory (or relative path)."""
+    path1 = os.path.join(APP_DIR, filename)
+    if os.path.exists(path1):
+        return path1
+    if os.path.exists(filename):
+        return os.path.abspath(filename)
+    return None
+
+
 def get_file_bytes(filename: str):
     """Read file bytes from app directory (or relative path)."""
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        path1 = os.path.join(script_dir, filename)
-        if os.path.exists(path1):
-            with open(path1, "rb") as f:
-                return f.read()
-
-        if os.path.exists(filename):
-            with open(filename, "rb") as f:
-                return f.read()
-
-        return None
+        path = find_app_file(filename)
+        if path is None:
+            return None
+        return get_asset_cache().get(path)
     except Exception as e:
         print(f"Error loading file: {e}")
         return None
@@ -42,717 +282,566 @@ def get_image_base64(image_filename: str):
     return base64.b64encode(data).decode()
 
 
-# ---------------------------
-# THEME STATE
-# ---------------------------
-if "theme" not in st.session_state:
-    st.session_state.theme = "light"
+def static_serving_enabled() -> bool:
+    """True when published assets reach the browser: through serve.py's
+    asset route or Streamlit's static serving."""
+    if ASSET_ROUTE:
+        return True
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
 
-# ---------------------------
-# SIDEBAR THEME TOGGLE (top)
-# ---------------------------
-with st.sidebar:
-    st.markdown("### 🎨 Theme")
-    theme_choice = st.radio(
-        "Theme",
-        ["Light", "Dark"],
-        index=0 if st.session_state.theme == "light" else 1,
-        label_visibility="collapsed"
-    )
-    st.session_state.theme = "light" if theme_choice == "Light" else "dark"
 
-theme = st.session_state.theme
+def hashed_name(filename: str, data: bytes) -> str:
+    """``name.<hash>.ext`` so a file's URL changes whenever its bytes do."""
+    stem, ext = os.path.splitext(os.path.basename(filename))
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
 
-# ---------------------------
-# CSS (Light/Dark + Narrow Sidebar + Mobile Fixes)
-# ---------------------------
-st.markdown(f"""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700;800;900&display=swap');
-
-* {{
-  font-family: 'Poppins', sans-serif;
-}}
-
-/* ---------------------------
-   THEME VARIABLES
---------------------------- */
-:root {{
-  --bg1: #667eea;
-  --bg2: #764ba2;
-
-  --panel: rgba(255,255,255,0.95);
-  --panel2: rgba(255,255,255,0.10);
-
-  --text: #111827;
-  --muted: #6B7280;
-
-  --shadow: 0 8px 24px rgba(0,0,0,0.10);
-  --shadow2: 0 16px 48px rgba(0,0,0,0.20);
-
-  --accent1: #667eea;
-  --accent2: #764ba2;
-}}
-
-{"/* DARK THEME OVERRIDES */" if theme == "dark" else ""}
-{"\
-:root {\
-  --panel: rgba(17,24,39,0.92);\
-  --panel2: rgba(255,255,255,0.08);\
-  --text: #F9FAFB;\
-  --muted: #D1D5DB;\
-  --shadow: 0 8px 24px rgba(0,0,0,0.35);\
-  --shadow2: 0 16px 48px rgba(0,0,0,0.55);\
-}\
-" if theme == "dark" else ""}
-
-/* ---------------------------
-   BACKGROUND
---------------------------- */
-.stApp {{
-  background: linear-gradient(135deg, var(--bg1) 0%, var(--bg2) 100%);
-  background-attachment: fixed;
-}}
-
-/* Space for header/sidebar toggle */
-.block-container {{
-  padding-top: 2.5rem !important;
-}}
-
-/* Hide menu/footer only */
-#MainMenu {{visibility: hidden;}}
-footer {{visibility: hidden;}}
-
-/* Sidebar toggle - ALWAYS VISIBLE */
-[data-testid="collapsedControl"],
-[data-testid="stSidebarCollapsedControl"] {{
-  z-index: 9999 !important;
-  visibility: visible !important;
-  display: flex !important;
-  opacity: 1 !important;
-  border-radius: 999px !important;
-  background: rgba(255,255,255,0.92) !important;
-  box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
-}}
-{"\
-[data-testid='collapsedControl'],\
-[data-testid='stSidebarCollapsedControl'] {\
-  background: rgba(17,24,39,0.85) !important;\
-}\
-" if theme == "dark" else ""}
-
-/* Also ensure the expand arrow button is visible */
-button[kind="headerNoPadding"],
-[data-testid="stSidebarNavItems"],
-section[data-testid="stSidebar"] + div button {{
-  visibility: visible !important;
-  display: flex !important;
-  opacity: 1 !important;
-  z-index: 9999 !important;
-}}
-
-/* ---------------------------
-   SIDEBAR WIDTH (NARROW)
---------------------------- */
-[data-testid="stSidebar"] {{
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-right: 1px solid rgba(255,255,255,0.20);
-  box-shadow: 4px 0 24px rgba(0,0,0,0.10);
-  width: 300px !important;
-}}
-[data-testid="stSidebar"] > div:first-child {{
-  padding-top: 1.25rem;
-  width: 300px !important;
-}}
-
-/* ---------------------------
-   COMPONENTS
---------------------------- */
-.glass-card {{
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-radius: 24px;
-  padding: 2.5rem;
-  border: 1px solid rgba(255,255,255,0.25);
-  box-shadow: var(--shadow);
-  margin-bottom: 2rem;
-  transition: all 0.3s ease;
-  color: var(--text);
-}}
-.glass-card:hover {{
-  transform: translateY(-8px);
-  box-shadow: var(--shadow2);
-}}
-
-.hero-glass {{
-  background: var(--panel2);
-  backdrop-filter: blur(20px);
-  border-radius: 32px;
-  padding: 4rem;
-  border: 1px solid rgba(255,255,255,0.20);
-  box-shadow: 0 8px 32px rgba(0,0,0,0.20);
-  margin-bottom: 3rem;
-  color: white;
-}}
-
-.profile-container {{
-  text-align: center;
-  margin-bottom: 1.25rem;
-}}
-.profile-img {{
-  border-radius: 50%;
-  width: 170px;
-  height: 170px;
-  object-fit: cover;
-  border: 5px solid rgba(255,255,255,0.85);
-  box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
-  margin: 0 auto;
-  display: block;
-  transition: all 0.3s ease;
-}}
-.profile-img:hover {{
-  transform: scale(1.05);
-}}
-
-.skill-badge {{
-  display: inline-block;
-  padding: 8px 16px;
-  margin: 5px;
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  color: white;
-  border-radius: 20px;
-  font-size: 0.85rem;
-  font-weight: 600;
-  box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-  transition: all 0.3s ease;
-}}
-.skill-badge:hover {{
-  transform: translateY(-2px);
-}}
-
-.stat-box {{
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-radius: 20px;
-  padding: 2rem;
-  text-align: center;
-  border: 1px solid rgba(255,255,255,0.25);
-  box-shadow: var(--shadow);
-  transition: all 0.3s ease;
-  color: var(--text);
-}}
-.stat-box:hover {{
-  transform: translateY(-5px);
-}}
-.stat-number {{
-  font-size: 3rem;
-  font-weight: 900;
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  -webkit-background-clip: text;
-  -webkit-text-fill-color: transparent;
-  background-clip: text;
-  line-height: 1;
-  margin-bottom: 0.5rem;
-}}
-.stat-label {{
-  font-size: 0.85rem;
-  color: var(--muted);
-  font-weight: 600;
-  letter-spacing: 0.05em;
-}}
-
-.timeline-card {{
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-left: 4px solid var(--accent1);
-  border-radius: 16px;
-  padding: 1.5rem;
-  margin-bottom: 1.5rem;
-  box-shadow: 0 4px 16px rgba(0,0,0,0.08);
-  transition: all 0.3s ease;
-  color: var(--text);
-}}
-.timeline-card:hover {{
-  transform: translateX(8px);
-  border-left-color: var(--accent2);
-}}
-
-.gradient-text {{
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  -webkit-background-clip: text;
-  -webkit-text-fill-color: transparent;
-  background-clip: text;
-  font-weight: 800;
-}}
-
-.contact-item {{
-  padding: 0.75rem;
-  margin: 0.5rem 0;
-  background: rgba(102, 126, 234, 0.12);
-  border-radius: 12px;
-  border-left: 3px solid var(--accent1);
-  transition: all 0.3s ease;
-  color: var(--text);
-}}
-.contact-item:hover {{
-  background: rgba(102, 126, 234, 0.20);
-  transform: translateX(5px);
-}}
-
-.project-card {{
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-radius: 20px;
-  padding: 2rem;
-  border: 1px solid rgba(255,255,255,0.25);
-  box-shadow: var(--shadow);
-  height: 100%;
-  transition: all 0.3s ease;
-  color: var(--text);
-}}
-.project-card:hover {{
-  transform: translateY(-8px);
-}}
-
-.featured-project {{
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  color: white;
-  border: none;
-}}
-.featured-project * {{
-  color: white !important;
-}}
-
-.stButton > button {{
-  width: 100%;
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  color: white !important;
-  border: none;
-  border-radius: 12px;
-  padding: 0.75rem 1.5rem;
-  font-weight: 600;
-  box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-  transition: all 0.3s ease;
-}}
-.stButton > button:hover {{
-  transform: translateY(-2px);
-  box-shadow: 0 8px 20px rgba(102, 126, 234, 0.5);
-}}
-
-.stTabs [data-baseweb="tab-list"] {{
-  gap: 8px;
-  background: var(--panel);
-  backdrop-filter: blur(10px);
-  border-radius: 16px;
-  padding: 8px;
-}}
-.stTabs [data-baseweb="tab"] {{
-  border-radius: 12px;
-  color: var(--muted);
-  font-weight: 600;
-  padding: 12px 24px;
-}}
-.stTabs [aria-selected="true"] {{
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  color: white !important;
-}}
-
-/* Scrollbar */
-::-webkit-scrollbar {{ width: 10px; height: 10px; }}
-::-webkit-scrollbar-track {{ background: rgba(255, 255, 255, 0.1); }}
-::-webkit-scrollbar-thumb {{
-  background: linear-gradient(135deg, var(--accent1) 0%, var(--accent2) 100%);
-  border-radius: 10px;
-}}
-
-/* ---------------------------
-   MOBILE RESPONSIVE FIXES
---------------------------- */
-@media (max-width: 768px) {{
-  [data-testid="stSidebar"] {{
-    width: 260px !important;
-  }}
-  [data-testid="stSidebar"] > div:first-child {{
-    width: 260px !important;
-  }}
-
-  .hero-glass {{
-    padding: 2rem !important;
-    border-radius: 24px !important;
-  }}
-
-  .profile-img {{
-    width: 130px !important;
-    height: 130px !important;
-  }}
-
-  .glass-card {{
-    padding: 1.5rem !important;
-    border-radius: 18px !important;
-  }}
-
-  .project-card {{
-    padding: 1.5rem !important;
-  }}
-}}
-</style>
-""", unsafe_allow_html=True)
 
-# ---------------------------
-# SIDEBAR CONTENT
-# ---------------------------
-with st.sidebar:
-    st.markdown('<div class="profile-container">', unsafe_allow_html=True)
+def precompress(data: bytes) -> dict:
+    """gzip and (with the brotli package) Brotli copies of ``data`` that are
+    at least PRECOMPRESS_MIN_SAVING smaller, as {encoding: bytes}."""
+    copies = {"gzip": gzip.compress(data, 9, mtime=0)}
+    try:
+        import brotli
+        copies["br"] = brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    limit = len(data) * (1 - PRECOMPRESS_MIN_SAVING)
+    return {encoding: copy for encoding, copy in copies.items() if len(copy) <= limit}
+
+
+class AssetManifest:
+    """Content-hashed copies of served files, listed in ``manifest.json``.
+
+    Each source file is published to ``assets_dir`` as ``name.<hash>.ext``
+    (see hashed_name), with ``.gz``/``.br`` copies for text-like files. The
+    manifest maps the source's path to its current copy and remembers the
+    source's mtime and size, so a restarted process reuses earlier copies
+    without reading or hashing the sources again. A superseded copy is
+    deleted once no source refers to it, and so are the entries and copies
+    of sources that no longer exist (pruned CV builds, old photo variants)
+    whenever a new copy is published and when a process starts.
+    """
+
+    SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+    def __init__(self, assets_dir: str):
+        self.assets_dir = assets_dir
+        self.path = os.path.join(assets_dir, "manifest.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self._entries = json.load(f)["files"]
+        except (OSError, ValueError, KeyError):
+            self._entries = {}  # source key -> {"file", "mtime_ns", "size", "encodings"}
+        self.prune()
+
+    @staticmethod
+    def key(path: str) -> str:
+        """Manifest key of a source: its path relative to the app directory."""
+        if path.startswith(APP_DIR + os.sep):
+            return os.path.relpath(path, APP_DIR).replace(os.sep, "/")
+        return path
+
+    @staticmethod
+    def source(key: str) -> str:
+        return key if os.path.isabs(key) else os.path.join(APP_DIR, *key.split("/"))
+
+    def publish(self, path: str) -> str:
+        """Name of the published copy of ``path``, publishing it if stale."""
+        stat = os.stat(path)
+        key = self.key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry
+            and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size)
+            and os.path.exists(os.path.join(self.assets_dir, entry["file"]))
+        ):
+            return entry["file"]
+
+        data = get_asset_cache().get(path)
+        name = hashed_name(path, data)
+        copies = {"": data}
+        if name.endswith(PRECOMPRESS_EXTENSIONS):
+            copies.update({self.SUFFIXES[encoding]: copy for encoding, copy in precompress(data).items()})
+        os.makedirs(self.assets_dir, exist_ok=True)
+        for suffix, copy in copies.items():
+            target = os.path.join(self.assets_dir, name + suffix)
+            if not os.path.exists(target):
+                tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(copy)
+                os.replace(tmp, target)
+
+        with self._lock:
+            old = self._entries.get(key)
+            self._entries[key] = {
+                "file": name,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "encodings": {
+                    encoding: len(copies[suffix]) for encoding, suffix in self.SUFFIXES.items() if suffix in copies
+                },
+            }
+            stale = old["file"] if old and all(e["file"] != old["file"] for e in self._entries.values()) else None
+            self._save()
+        if stale:
+            self._remove_copies(stale)
+        self.prune()
+        return name
+
+    def prune(self) -> int:
+        """Forget sources that no longer exist, deleting their copies; returns how many."""
+        with self._lock:
+            gone = [key for key in self._entries if not os.path.exists(self.source(key))]
+            if not gone:
+                return 0
+            files = {self._entries.pop(key)["file"] for key in gone}
+            files -= {entry["file"] for entry in self._entries.values()}
+            self._save()
+        for name in files:
+            self._remove_copies(name)
+        return len(gone)
+
+    def _remove_copies(self, name: str):
+        for suffix in ("", *self.SUFFIXES.values()):
+            try:
+                os.remove(os.path.join(self.assets_dir, name + suffix))
+            except OSError:
+                pass
+
+    def _save(self):
+        """Write the manifest atomically; called with the lock held."""
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"files": self._entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def stats(self) -> dict:
+        """Published files and their sizes, raw and precompressed."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return {
+            "files": len(entries),
+            "bytes": sum(entry["size"] for entry in entries),
+            **{
+                f"{encoding}_bytes": sum(entry["encodings"].get(encoding, entry["size"]) for entry in entries)
+                for encoding in self.SUFFIXES
+            },
+        }
 
-    img_base64 = get_image_base64("profile_photo.png")
-    if img_base64:
-        st.markdown(
-            f'<img src="data:image/png;base64,{img_base64}" class="profile-img">',
-            unsafe_allow_html=True
-        )
-    else:
-        st.info("📸 Add 'profile_photo.png' for your profile picture")
 
-    st.markdown("<h2 style='text-align: center; margin: 1rem 0 0.5rem 0;' class='gradient-text'>RAJA ROY</h2>", unsafe_allow_html=True)
-    st.markdown("<p style='text-align: center; color: var(--muted); font-weight: 700; font-size: 0.85rem; letter-spacing: 0.1em;'>AI ENGINEER & DATA SCIENTIST</p>", unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+@st.cache_resource
+def get_asset_manifest() -> AssetManifest:
+    """One asset manifest per process, shared across sessions and reruns."""
+    return AssetManifest(ASSETS_DIR)
 
-    st.markdown("---")
 
-    st.markdown("### 📬 Contact")
-    st.markdown("""
-        <div class="contact-item">
-            <strong>📧 Email</strong><br>
-            rajaroybca6@gmail.com
-        </div>
-        <div class="contact-item">
-            <strong>📱 Phone</strong><br>
-            +39 388 381 8145
-        </div>
-        <div class="contact-item">
-            <strong>📍 Location</strong><br>
-            Torino, Italy
-        </div>
-    """, unsafe_allow_html=True)
+@st.cache_resource
+def publish_static_file(filename: str, mtime_ns: int):
+    """Publish an app file through the asset manifest and return its URL.
 
-    st.markdown("---")
+    The URL carries the content hash, so browsers may cache it for good.
+    Errors propagate, so a failed publish is not cached.
+    """
+    return f"{ASSETS_URL}/{get_asset_manifest().publish(find_app_file(filename))}"
 
-    st.markdown("### 🌍 Languages")
-    st.markdown("""
-        <div style="padding: 0.5rem; color: var(--text);">
-            🇬🇧 <strong>English</strong> - Native<br>
-            🇮🇹 <strong>Italian</strong> - B2<br>
-            🇮🇳 <strong>Hindi</strong> - Native
-        </div>
-    """, unsafe_allow_html=True)
 
-    st.markdown("---")
+def get_static_url(filename: str):
+    """URL of an app file's published copy, or None if unavailable."""
+    if not static_serving_enabled():
+        return None
+    path = find_app_file(filename)
+    if path is None:
+        return None
+    try:
+        return publish_static_file(filename, os.stat(path).st_mtime_ns)
+    except OSError as e:
+        print(f"Error publishing file: {e}")
+        return None
 
-    st.markdown("### 🎓 Current Study")
-    st.markdown("""
-        <div style="padding: 0.75rem; background: rgba(102, 126, 234, 0.12); border-radius: 12px; border-left: 3px solid var(--accent1); color: var(--text);">
-            <strong>Master of Science in Artificial Intelligence | Machine Learning Engineer</strong><br>
-            INFOR ELEA Smart Business Academy<br>
-            <small>Oct 2025 - Present</small>
-        </div>
-    """, unsafe_allow_html=True)
 
-    st.markdown("---")
+def get_image_src(image_filename: str, mime: str = "image/png"):
+    """Image ``src`` for HTML: a cacheable static URL, else a base64 data URI."""
+    if PHOTO_DELIVERY == "static":
+        url = get_static_url(image_filename)
+        if url:
+            return url
+    img_base64 = get_image_base64(image_filename)
+    if not img_base64:
+        return None
+    return f"data:{mime};base64,{img_base64}"
+
+
+def font_files() -> dict:
+    """Built Poppins faces under static/fonts, as {weight: filename}."""
+    faces = {}
+    if os.path.isdir(FONTS_DIR):
+        for name in os.listdir(FONTS_DIR):
+            match = re.fullmatch(r"poppins-(\d{3})\.woff2", name)
+            if match:
+                faces[int(match.group(1))] = name
+    return dict(sorted(faces.items()))
+
+
+def font_face_css(urls: dict) -> str:
+    """@font-face rules for the Poppins faces in ``urls`` ({weight: url})."""
+    return "".join(
+        f"@font-face{{font-family:'Poppins';font-style:normal;font-weight:{weight};"
+        f"font-display:swap;src:url({url}) format('woff2')}}"
+        for weight, url in urls.items()
+    )
 
-    cv_filename = "Raja_Roy_CV.pdf"
-    cv_bytes = get_file_bytes(cv_filename)
 
-    if cv_bytes:
-        st.download_button(
-            label="📥 Download CV (PDF)",
-            data=cv_bytes,
-            file_name=cv_filename,
-            mime="application/pdf",
-            use_container_width=True
-        )
-    else:
-        st.warning(f"⚠️ CV not found. Add '{cv_filename}' to your app folder.")
+def font_preload_links(urls: dict) -> str:
+    """<link rel=preload> tags for the above-the-fold faces in ``urls``."""
+    return "".join(
+        f'<link rel="preload" href="{escape(urls[weight])}" as="font" type="font/woff2" crossorigin>'
+        for weight in PRELOAD_FONT_WEIGHTS
+        if weight in urls
+    )
 
 
-# ---------------------------
-# HERO SECTION
-# ---------------------------
-st.markdown("""
-    <div class="hero-glass">
-        <p style="font-weight: 700; font-size: 0.85rem; letter-spacing: 0.2em; margin-bottom: 1rem; opacity: 0.9;">SENIOR DATA ANALYST • FULL-STACK DEVELOPER</p>
-        <h1 style="font-size: 4rem; line-height: 1; margin-bottom: 1.5rem;">
-            Building Intelligent<br>
-            <span style="color: #fff; text-shadow: 0 0 30px rgba(255,255,255,0.5);">Data Solutions</span>
-        </h1>
-        <p style="font-size: 1.2rem; max-width: 800px; margin-bottom: 2.5rem; line-height: 1.7; opacity: 0.95;">
-            Transforming complex data into actionable insights with 8+ years of expertise in analytics,
-            machine learning, and full-stack development. Specialized in creating production-grade
-            AI-enabled solutions that drive measurable business value.
-        </p>
-        <div style="display: flex; gap: 1rem; flex-wrap: wrap;">
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">Python</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">GEN AI</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">MS.OFFICE</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">HTML</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">CSS & BOOTSTRAP</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">SQL</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">Machine Learning</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">Power BI</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">PHP</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">LLM</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">JAVASCRIPT</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">WORDPRESS</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">POSTGRESQL</span>
-            <span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">AWS</span>
-        </div>
-    </div>
-""", unsafe_allow_html=True)
+def get_font_urls() -> dict:
+    """Published URLs of the self-hosted faces, or {} when unavailable."""
+    urls = {weight: get_static_url(os.path.join(FONTS_DIR, name)) for weight, name in font_files().items()}
+    return {weight: url for weight, url in urls.items() if url}
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def scope_css(css: str, scope: str) -> str:
+    """Restrict the (flat, minified) rules in ``css`` to elements under ``scope``."""
+    def prefix(match):
+        selectors = []
+        for sel in match.group(1).split(","):
+            if sel.startswith(":root"):
+                selectors.append(scope + sel[len(":root"):])
+            else:
+                selectors.append(f"{scope} {sel}")
+        return ",".join(selectors) + "{"
+    return re.sub(r"([^{}]+)\{", prefix, css)
+
+
+def build_css(theme: str) -> str:
+    """Minified CSS of a theme's sources, scoped as configured."""
+    parts = []
+    for name, scope in STYLE_SOURCES[theme]:
+        data = get_file_bytes(os.path.join(STYLES_DIR, name))
+        if data:
+            css = minify_css(data.decode("utf-8"))
+            parts.append(scope_css(css, scope) if scope else css)
+    return "".join(parts)
+
+
+@st.cache_resource
+def compile_stylesheet(theme: str, source_mtimes: tuple) -> str:
+    """Build the <style> element for a theme once per version of its sources."""
+    font_urls = get_font_urls()
+    font_css = font_face_css(font_urls) if font_urls else GOOGLE_FONTS_IMPORT
+    css = font_css + build_css(theme)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    return f'{font_preload_links(font_urls)}<style id="portfolio-css-{theme}-{digest}">{css}</style>'
+
+
+def get_stylesheet(theme: str) -> str:
+    """Cached stylesheet bundle for ``theme``; recompiled when a source changes."""
+    mtimes = []
+    for name, _ in STYLE_SOURCES[theme]:
+        path = os.path.join(STYLES_DIR, name)
+        mtimes.append(os.stat(path).st_mtime_ns if os.path.exists(path) else 0)
+    # Adding, rebuilding or removing a font face changes the directory mtime.
+    mtimes.append(os.stat(FONTS_DIR).st_mtime_ns if os.path.isdir(FONTS_DIR) else 0)
+    return compile_stylesheet(theme, tuple(mtimes))
+
+
+# Sidebar theme switch for THEME_MODE="client": flips <html data-theme> in the
+# browser and remembers the choice in sessionStorage, so no rerun is needed.
+THEME_TOGGLE_HTML = """
+<div class="theme-toggle" role="group" aria-label="Theme">
+  <button type="button" data-theme-choice="light">☀️ Light</button>
+  <button type="button" data-theme-choice="dark">🌙 Dark</button>
+</div>
+<script>
+(function () {
+  var root = document.documentElement;
+  var key = "portfolio-theme";
+  root.dataset.theme = sessionStorage.getItem(key) || "light";
+  if (window.portfolioThemeToggle) return;
+  window.portfolioThemeToggle = true;
+  document.addEventListener("click", function (event) {
+    var button = event.target.closest("[data-theme-choice]");
+    if (!button) return;
+    root.dataset.theme = button.dataset.themeChoice;
+    sessionStorage.setItem(key, root.dataset.theme);
+  });
+})();
+</script>
+"""
+
 
 # ---------------------------
-# STATS
+# CONTENT
 # ---------------------------
-st.markdown("## 📊 Professional Impact")
-c1, c2, c3, c4 = st.columns(4)
+# Expected shape of CONTENT_FILE. A dict lists required keys, a one-item list
+# means "list of", and a type is the required value type. Extra keys are allowed.
+CONTENT_SCHEMA = {
+    "labels": {
+        "theme": str, "page_language": str, "contact": str, "languages": str, "current_study": str,
+        "download_cv": str, "impact": str, "tabs": [str],
+        "featured_projects": str, "featured_eyebrow": str, "view_demo": str, "try_demo": str,
+        "demo_status": {"up": str, "sleeping": str, "down": str, "unknown": str},
+        "filters": {"title": str, "technology": str, "domain": str, "year": str, "showing": str, "no_matches": str},
+        "contact_form": {
+            "open": str, "name": str, "email": str, "message": str, "send": str,
+            "sent": str, "invalid": str, "too_soon": str,
+        },
+        "key_achievements": str, "web_projects": str, "experience": str,
+        "education": str, "skills": str, "about": str, "goals": str,
+        "current_focus": str, "interests": str,
+    },
+    "profile": {"name": str, "title": str, "photo": str, "cv": str},
+    "contact": [{"icon": str, "label": str, "value": str}],
+    "languages": [{"flag": str, "name": str, "level": str}],
+    "current_study": {"title": str, "school": str, "period": str},
+    "hero": {"eyebrow": str, "headline": str, "highlight": str, "summary": str, "badges": [str]},
+    "stats": [{"value": str, "label": str}],
+    "featured_projects": [{"title": str, "description": str, "demo_url": str, "tech": [str], "achievements": [str]}],
+    "web_projects": [{"title": str, "description": str, "tech": [str]}],
+    "experience": [{"company": str, "location": str, "role": str, "period": str, "description": str, "skills": [str]}],
+    "education": [{"degree": str, "school": str, "location": str, "period": str, "grade": str, "details": str}],
+    "skills": [{"category": str, "skills": [str]}],
+    "about": {
+        "paragraphs_html": [str],
+        "focus_html": str,
+        "interests": [{"icon": str, "title": str, "detail": str}],
+    },
+    "footer": {"heading": str, "text": str, "icons": str, "email": str, "phone": str, "tagline": str},
+}
+
+
+def validate_content(value, schema=CONTENT_SCHEMA, path="content"):
+    """Raise ValueError naming the first place ``value`` doesn't match ``schema``."""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"{path}: expected an object")
+        for key, sub_schema in schema.items():
+            if key not in value:
+                raise ValueError(f"{path}: missing '{key}'")
+            validate_content(value[key], sub_schema, f"{path}.{key}")
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected a list")
+        for i, item in enumerate(value):
+            validate_content(item, schema[0], f"{path}[{i}]")
+    elif not isinstance(value, schema):
+        raise ValueError(f"{path}: expected {schema.__name__}")
+
+
+def merge_content(base, overlay):
+    """``overlay`` laid over ``base``: objects merge by key, lists by position.
+
+    A null in the overlay keeps the base value, so list entries that aren't
+    translated yet can be skipped with ``null``.
+    """
+    if overlay is None:
+        return base
+    if isinstance(base, dict) and isinstance(overlay, dict):
+        merged = dict(base)
+        for key, value in overlay.items():
+            merged[key] = merge_content(base[key], value) if key in base else value
+        return merged
+    if isinstance(base, list) and isinstance(overlay, list):
+        merged = [merge_content(b, o) for b, o in zip(base, overlay)]
+        return merged + base[len(overlay):] + overlay[len(base):]
+    return overlay
+
+
+@st.cache_resource(max_entries=256)
+def compile_content(digest: str, base_dir: str, _raw: bytes, _overlay: bytes = None) -> dict:
+    """Parse, merge and validate a locale's content once per content hash.
+
+    The photo and CV paths are resolved against ``base_dir``, the profile's
+    directory. The returned dict is shared by every session and must not
+    be mutated.
+    """
+    content = json.loads(_raw.decode("utf-8"))
+    if _overlay:
+        content = merge_content(content, json.loads(_overlay.decode("utf-8")))
+    validate_content(content)
+    content["profile"] = {
+        **content["profile"],
+        "photo": os.path.join(base_dir, content["profile"]["photo"]),
+        "cv": os.path.join(base_dir, content["profile"]["cv"]),
+    }
+    return content
+
+
+def profile_dir(profile: str) -> str:
+    """Directory of a profile; the default profile ("") is the app itself."""
+    return os.path.join(PROFILES_DIR, profile) if profile else APP_DIR
+
+
+def profile_exists(profile: str) -> bool:
+    """True for "" and for safe names with a content file under PROFILES_DIR."""
+    if not profile:
+        return True
+    return bool(re.fullmatch(r"[a-z0-9][a-z0-9_-]{0,63}", profile)) and os.path.isfile(
+        os.path.join(profile_dir(profile), CONTENT_FILE)
+    )
 
-with c1:
-    st.markdown("""<div class="stat-box"><div class="stat-number">8+</div><div class="stat-label">YEARS EXPERIENCE</div></div>""", unsafe_allow_html=True)
-with c2:
-    st.markdown("""<div class="stat-box"><div class="stat-number">5</div><div class="stat-label">COMPANIES</div></div>""", unsafe_allow_html=True)
-with c3:
-    st.markdown("""<div class="stat-box"><div class="stat-number">15+</div><div class="stat-label">TECH SKILLS</div></div>""", unsafe_allow_html=True)
-with c4:
-    st.markdown("""<div class="stat-box"><div class="stat-number">100%</div><div class="stat-label">DEDICATION</div></div>""", unsafe_allow_html=True)
 
-st.markdown("<br><br>", unsafe_allow_html=True)
+def load_content(locale: str = DEFAULT_LOCALE, profile: str = ""):
+    """Return ``(content, version)`` for a profile and locale.
+
+    The version is the content hash, prefixed with the profile and locale
+    when not the defaults. Everything cached per content version
+    (fragments, markup, tag index, CV) is therefore cached per profile and
+    locale too.
+    """
+    base_dir = profile_dir(profile)
+    raw = get_file_bytes(os.path.join(base_dir, CONTENT_FILE))
+    if raw is None:
+        raise FileNotFoundError(f"Content file '{CONTENT_FILE}' not found in {base_dir}")
+    overlay = None
+    if locale != DEFAULT_LOCALE:
+        overlay = get_file_bytes(os.path.join(base_dir, LOCALES_DIR, f"{locale}.json"))
+    digest = hashlib.sha256(raw + b"\0" + overlay if overlay else raw).hexdigest()[:12]
+    version = "-".join(part for part in (profile, "" if locale == DEFAULT_LOCALE else locale, digest) if part)
+    return compile_content(digest, base_dir, raw, overlay), version
+
 
 # ---------------------------
-# TABS
+# RENDERING
 # ---------------------------
-tab1, tab2, tab3, tab4 = st.tabs(["🚀 Projects", "💼 Experience", "🎓 Education & Skills", "👤 About Me"])
+def ping_attr(kind: str) -> str:
+    """``ping`` attribute that reports a link's clicks to serve.py as ``kind``."""
+    return f' ping="events/{kind}"' if ANALYTICS and ASSET_ROUTE else ""
 
-with tab1:
-    st.markdown("## Featured Projects")
 
-    # --- Project 1: Fraud Detection ---
-    colA, colB = st.columns([2, 1])
+def render_badges(items) -> str:
+    """Row of .skill-badge spans."""
+    return ''.join([f'<span class="skill-badge">{escape(item)}</span>' for item in items])
 
-    with colA:
-        st.markdown("""
-            <div class="featured-project project-card">
-                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">🏆 FEATURED ML PROJECT</p>
-                <h3 style="margin-bottom: 1rem;">Fraud Detection & Supply Chain Analytics</h3>
-                <p style="margin-bottom: 2rem; line-height: 1.7; opacity: 0.95;">
-                    Designed and implemented machine learning models to detect fraudulent transactions and predict
-                    on-time versus delayed shipments. Leveraged data preprocessing, feature engineering, and
-                    classification techniques (Random Forest, Logistic Regression, XGBoost) to support operational
-                    decision-making with 90%+ accuracy.
-                </p>
-                <div style="margin-bottom: 1.5rem;">
-                    <a href="https://logisticmanagement.streamlit.app/" target="_blank" style="
-                     display: inline-block;
-                     background: #ffffff !important;
-                     color: #4e54c8 !important;
-                     padding: 12px 24px;
-                     border-radius: 12px;
-                    text-decoration: none;
-                     font-weight: 700;
-                     box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                    ">
-                        🚀 View Live Demo →
-                    </a>
-                </div>
-                <div>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Python</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Scikit-learn</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Pandas</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Feature Engineering</span>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
 
-    with colB:
-        st.markdown("""
-            <div class="glass-card" style="background: rgba(102, 126, 234, 0.95); color: white; height: 100%;">
-                <h4 style="margin-top: 0;">🎯 Key Achievements</h4>
-                <p style="line-height: 1.8;">
-                    ✓ Built classification models<br>
-                    ✓ Data preprocessing & cleaning<br>
-                    ✓ Feature engineering pipeline<br>
-                    ✓ Model evaluation & tuning<br>
-                    ✓ Business-ready insights
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+def render_photo(urls: dict, alt: str) -> str:
+    """``<picture>`` offering each format's variants ({format: {width: url}}).
 
-    st.markdown("<br>", unsafe_allow_html=True)
+    The browser takes the first type it supports and, from its srcset, the
+    width PHOTO_SIZES calls for at the screen's density.
+    """
+    def srcset(fmt):
+        return ", ".join(f"{escape(url)} {width}w" for width, url in sorted(urls[fmt].items()))
 
-    # --- Project 2: AI DJ Remix Engine ---
-    colC, colD = st.columns([2, 1])
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{srcset(fmt)}" sizes="{PHOTO_SIZES}">' for fmt in urls if fmt != "png"
+    )
+    size = PHOTO_DISPLAY_PX[0]
+    src = urls["png"][min(urls["png"], key=lambda width: abs(width - size))]
+    return (
+        f'<picture>{sources}<img src="{escape(src)}" srcset="{srcset("png")}" sizes="{PHOTO_SIZES}" '
+        f'width="{size}" height="{size}" alt="{escape(alt)}" class="profile-img"></picture>'
+    )
 
-    with colC:
-        st.markdown("""
-            <div class="featured-project project-card">
-                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">🏆 FEATURED ML PROJECT</p>
-                <h3 style="margin-bottom: 1rem;">Design & Development of a Hybrid AI DJ Music Remix Engine System</h3>
-                <p style="margin-bottom: 2rem; line-height: 1.7; opacity: 0.95;">
-                    Developed a high-energy system that bridges the gap between manual mixing and AI automation. Users can perform live with a real-time DJ interface or leverage a neural "AI-to-DJ" pipeline to automatically transform standard tracks into club-ready remixes. Designed for music lovers, the platform features intelligent audio processing for one-click DJ conversions and instant downloads.
-                </p>
-                <div style="margin-bottom: 1.5rem;">
-                    <a href="https://neuraldj.streamlit.app/" target="_blank" style="
-                     display: inline-block;
-                     background: #ffffff !important;
-                     color: #4e54c8 !important;
-                     padding: 12px 24px;
-                     border-radius: 12px;
-                    text-decoration: none;
-                     font-weight: 700;
-                     box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                    ">
-                        🚀 View Live Demo →
-                    </a>
-                </div>
-                <div>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Python & Django</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Scikit-learn</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Pandas & Numpy & Xgboost</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Feature Engineering</span>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
 
-    with colD:
-        st.markdown("""
-            <div class="glass-card" style="background: rgba(102, 126, 234, 0.95); color: white; height: 100%;">
-                <h4 style="margin-top: 0;">🎯 Key Achievements</h4>
-                <p style="line-height: 1.8;">
-                    ✓ Built high performance AI Hybrid DJ models<br>
-                    ✓ Background noise removal preprocessing & cleaning<br>
-                    ✓ AI has built a high-energy music<br>
-                    ✓ Model evaluation & tuning<br>
-                    ✓ Business-ready insights
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+def render_profile(content: dict, photo) -> str:
+    """Profile card; ``photo`` is an image src or variant URLs for render_photo."""
+    profile = content["profile"]
+    if isinstance(photo, dict):
+        img = render_photo(photo, profile["name"])
+    else:
+        img = f'<img src="{escape(photo)}" class="profile-img">' if photo else ""
+    return f"""
+        <div class="profile-container">
+            {img}
+            <h2 style='text-align: center; margin: 1rem 0 0.5rem 0;' class='gradient-text'>{escape(profile['name'])}</h2>
+            <p style='text-align: center; color: var(--muted); font-weight: 700; font-size: 0.85rem; letter-spacing: 0.1em;'>{escape(profile['title'])}</p>
+        </div>
+    """
 
-    st.markdown("<br>", unsafe_allow_html=True)
 
-    # --- Project 3: Real-Time License Plate Recognition System ---
-    colE, colF = st.columns([2, 1])
+def render_contact(content: dict) -> str:
+    return "".join(f"""
+        <div class="contact-item">
+            <strong>{escape(item['icon'])} {escape(item['label'])}</strong><br>
+            {escape(item['value'])}
+        </div>""" for item in content["contact"])
 
-    with colE:
-        st.markdown("""
-            <div class="featured-project project-card">
-                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">🏆 FEATURED ML PROJECT</p>
-                <h3 style="margin-bottom: 1rem;">Real-Time License Plate Recognition System</h3>
-                <p style="margin-bottom: 2rem; line-height: 1.7; opacity: 0.95;">
-                    A production-ready ANPR system that streams live camera feed in the browser and detects multiple license plates simultaneously in real time. It combines a custom contour-based plate finder with a pre-trained binary OCR model to extract and label plate text frame-by-frame. Each plate is highlighted with a uniquely coloured bounding box with text overlaid on-screen. Detections are logged to a deduplicated session history across the full session. Fully compatible with mobile networks (4G/5G) and Wi-Fi via ICE/TURN relay configuration. Supports front and rear camera switching for flexible deployment.
-                </p>
-                <div style="margin-bottom: 1.5rem;">
-                    <a href="https://rajaroybca6-car-licence-plate-detection-app-ticxbh.streamlit.app/" target="_blank" style="
-                     display: inline-block;
-                     background: #ffffff !important;
-                     color: #4e54c8 !important;
-                     padding: 12px 24px;
-                     border-radius: 12px;
-                    text-decoration: none;
-                     font-weight: 700;
-                     box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                    ">
-                        🚀 View Live Demo →
-                    </a>
-                </div>
-                <div>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Python & Streamlit</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">WebRTC (ICE/TURN)</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Multi-camera support</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">streamlit-webrtc & OpenCV</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">PyAV & Custom PlateFinder</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">TensorFlow (.pb model)</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Binary OCR model</span>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
 
-    with colF:
-        st.markdown("""
-            <div class="glass-card" style="background: rgba(102, 126, 234, 0.95); color: white; height: 100%;">
-                <h4 style="margin-top: 0;">🎯 Key Achievements</h4>
-                <p style="line-height: 1.8;">
-                    ✓ Computer vision · OpenCV<br>
-                    ✓ OCR · character recognition<br>
-                    ✓ WebRTC · live video streaming<br>
-                    ✓ Multi-network deployment<br>
-                    ✓ Performance optimisation
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+def render_languages(content: dict) -> str:
+    rows = "<br>\n".join(
+        f"{escape(lang['flag'])} <strong>{escape(lang['name'])}</strong> - {escape(lang['level'])}"
+        for lang in content["languages"]
+    )
+    return f"""
+        <div style="padding: 0.5rem; color: var(--text);">
+            {rows}
+        </div>
+    """
 
-    st.markdown("<br>", unsafe_allow_html=True)
 
-    # --- Project 4: Audio to Text Converter ---
-    colG, colH = st.columns([2, 1])
+def render_current_study(content: dict) -> str:
+    study = content["current_study"]
+    return f"""
+        <div style="padding: 0.75rem; background: rgba(102, 126, 234, 0.12); border-radius: 12px; border-left: 3px solid var(--accent1); color: var(--text);">
+            <strong>{escape(study['title'])}</strong><br>
+            {escape(study['school'])}<br>
+            <small>{escape(study['period'])}</small>
+        </div>
+    """
 
-    with colG:
-        st.markdown("""
-            <div class="featured-project project-card">
-                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">🏆 FEATURED ML PROJECT</p>
-                <h3 style="margin-bottom: 1rem;">Audio to Text Converter</h3>
-                <p style="margin-bottom: 2rem; line-height: 1.7; opacity: 0.95;">
-                    Built a local-first transcription app powered by faster-whisper. Processes 4-hour audio files with int8 quantization — 3–4× faster than OpenAI Whisper on CPU. Supports 99+ languages, runs fully offline, and stores transcript history per session.
-                </p>
-                <div style="margin-bottom: 1.5rem;">
-                    <a href="https://audiototextversion2forwebapp-b46fnnuniiqzq2n9arpogz.streamlit.app/" target="_blank" style="
-                     display: inline-block;
-                     background: #ffffff !important;
-                     color: #4e54c8 !important;
-                     padding: 12px 24px;
-                     border-radius: 12px;
-                    text-decoration: none;
-                     font-weight: 700;
-                     box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                    ">
-                        🚀 View Live Demo →
-                    </a>
-                </div>
-                <div>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Python</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Streamlit</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">faster-whisper</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">NLP</span>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
 
-    with colH:
-        st.markdown("""
-            <div class="glass-card" style="background: rgba(102, 126, 234, 0.95); color: white; height: 100%;">
-                <h4 style="margin-top: 0;">🎯 Key Achievements</h4>
-                <p style="line-height: 1.8;">
-                    ✓ Local-first, fully offline<br>
-                    ✓ int8 CPU quantization<br>
-                    ✓ 99+ language support<br>
-                    ✓ Transcript history log<br>
-                    ✓ Multi-format audio input
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+def render_hero(content: dict) -> str:
+    hero = content["hero"]
+    badges = "\n".join(
+        f'<span style="background: rgba(255,255,255,0.25); padding: 10px 20px; border-radius: 12px; font-weight: 600; backdrop-filter: blur(10px);">{escape(badge)}</span>'
+        for badge in hero["badges"]
+    )
+    return f"""
+    <div class="hero-glass">
+        <p style="font-weight: 700; font-size: 0.85rem; letter-spacing: 0.2em; margin-bottom: 1rem; opacity: 0.9;">{escape(hero['eyebrow'])}</p>
+        <h1 style="font-size: 4rem; line-height: 1; margin-bottom: 1.5rem;">
+            {escape(hero['headline'])}<br>
+            <span style="color: #fff; text-shadow: 0 0 30px rgba(255,255,255,0.5);">{escape(hero['highlight'])}</span>
+        </h1>
+        <p style="font-size: 1.2rem; max-width: 800px; margin-bottom: 2.5rem; line-height: 1.7; opacity: 0.95;">
+            {escape(hero['summary'])}
+        </p>
+        <div style="display: flex; gap: 1rem; flex-wrap: wrap;">
+            {badges}
+        </div>
+    </div>
+"""
+
 
-    st.markdown("<br>", unsafe_allow_html=True)
+def render_stat(stat: dict) -> str:
+    return f"""<div class="stat-box"><div class="stat-number">{escape(stat['value'])}</div><div class="stat-label">{escape(stat['label'])}</div></div>"""
 
-    # --- Project 5: DeepWatch ---
-    colI, colJ = st.columns([2, 1])
 
-    with colI:
-        st.markdown("""
+def render_featured_project(project: dict, labels: dict):
+    """Featured project card and its "Key Achievements" side card."""
+    tech = "\n".join(
+        f'<span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">{escape(item)}</span>'
+        for item in project["tech"]
+    )
+    card = f"""
             <div class="featured-project project-card">
-                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">🏆 FEATURED ML PROJECT</p>
-                <h3 style="margin-bottom: 1rem;">DeepWatch v1.0 — AI CCTV Control Room</h3>
+                <p style="font-size: 0.75rem; font-weight: 700; letter-spacing: 0.2em; margin-bottom: 0.5rem; opacity: 0.9;">{escape(labels['featured_eyebrow'])}</p>
+                <h3 style="margin-bottom: 1rem;">{escape(project['title'])}</h3>
                 <p style="margin-bottom: 2rem; line-height: 1.7; opacity: 0.95;">
-                    DeepWatch is a full-stack AI security system that streams live camera feeds through a YOLOv8 object detection pipeline directly in the browser. It supports multi-camera switching, virtual boundary zones with breach detection, ByteTrack-style centroid person tracking with unique IDs, loitering time analysis, and real-time crowd density estimation. Events are persisted to SQLite, exportable as CSV or JSON, and critical detections — including weapons — trigger instant email alerts with annotated snapshots attached. The entire interface is rendered as a dark cyberpunk control room UI, built without any frontend framework, purely in Streamlit with custom CSS.
+                    {escape(project['description'])}
                 </p>
                 <div style="margin-bottom: 1.5rem;">
-                    <a href="https://rajaroybca6-deepwatch-app-35pfsm.streamlit.app/" target="_blank" style="
+                    <a href="{escape(project['demo_url'])}" target="_blank"{ping_attr("demo_clicked")} style="
                      display: inline-block;
                      background: #ffffff !important;
                      color: #4e54c8 !important;
@@ -762,275 +851,2093 @@ with tab1:
                      font-weight: 700;
                      box-shadow: 0 4px 12px rgba(0,0,0,0.2);
                     ">
-                        🚀 View Live Demo →
+                        {escape(labels['view_demo'])}
                     </a>
                 </div>
                 <div>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Python & Real-time DSP</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Scikit-learn & PyAudio · PyAV</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Pandas & NumPy · SciPy</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">FFT · STFT · Chroma & Streamlit</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">Generative AI & OpenCV</span>
-                    <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; margin: 4px; border-radius: 12px; display: inline-block; font-size: 0.85rem; font-weight: 600;">YOLOv8 & WebRTC</span>
+                    {tech}
                 </div>
             </div>
-        """, unsafe_allow_html=True)
-
-    with colJ:
-        st.markdown("""
+        """
+    achievements = "<br>\n".join(f"✓ {escape(item)}" for item in project["achievements"])
+    side = f"""
             <div class="glass-card" style="background: rgba(102, 126, 234, 0.95); color: white; height: 100%;">
-                <h4 style="margin-top: 0;">🎯 Key Achievements</h4>
+                <h4 style="margin-top: 0;">{escape(labels['key_achievements'])}</h4>
                 <p style="line-height: 1.8;">
-                    ✓ Audio signal processing · DSP<br>
-                    ✓ BPM detection · beat sync<br>
-                    ✓ Real-time audio pipeline<br>
-                    ✓ AI transition engine<br>
-                    ✓ Stem separation · deep learning<br>
-                    ✓ Generative AI · arrangement<br>
-                    ✓ Behavioral Intelligence<br>
-                    ✓ Key detection · harmonic mixing
+                    {achievements}
                 </p>
             </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("## Web Development Projects")
-
-    col1, col2 = st.columns(2)
+        """
+    return card, side
 
-    with col1:
-        st.markdown("""
-            <div class="project-card">
-                <h4 style="margin-bottom: 1rem;">🛒 Amazon Clone (E-Commerce)</h4>
-                <p style="color: var(--muted); line-height: 1.7; margin-bottom: 1.5rem;">
-                    Full-stack e-commerce platform with user authentication, shopping cart functionality,
-                    and payment integration. Built with modern web technologies and responsive design.
-                </p>
-                <div>
-                    <span class="skill-badge">HTML</span>
-                    <span class="skill-badge">CSS</span>
-                    <span class="skill-badge">JavaScript</span>
-                    <span class="skill-badge">PHP</span>
-                    <span class="skill-badge">SQL</span>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
 
-    with col2:
-        st.markdown("""
+def render_web_project(project: dict) -> str:
+    return f"""
             <div class="project-card">
-                <h4 style="margin-bottom: 1rem;">🏔️ West Bengal Tourism Portal</h4>
+                <h4 style="margin-bottom: 1rem;">{escape(project['title'])}</h4>
                 <p style="color: var(--muted); line-height: 1.7; margin-bottom: 1.5rem;">
-                    Informational tourism website featuring regional attractions, interactive maps,
-                    and booking capabilities. Optimized for performance and SEO.
+                    {escape(project['description'])}
                 </p>
                 <div>
-                    <span class="skill-badge">PHP</span>
-                    <span class="skill-badge">Bootstrap</span>
-                    <span class="skill-badge">MySQL</span>
-                    <span class="skill-badge">JavaScript</span>
+                    {render_badges(project['tech'])}
                 </div>
             </div>
-        """, unsafe_allow_html=True)
-
+        """
 
-with tab2:
-    st.markdown("## Professional Experience")
-
-    experiences = [
-        {
-            "company": "Elwood",
-            "location": "Torino, Italy",
-            "role": "Web Developer",
-            "period": "Jun 2025 - Oct 2025",
-            "description": "Developed and maintained full-stack web applications, customized WordPress themes and plugins, built responsive websites using PHP, HTML, CSS, Bootstrap, and JavaScript. Collaborated with designers and clients to deliver high-quality digital solutions.",
-            "skills": ["PHP", "WordPress", "JavaScript", "HTML/CSS", "Bootstrap"]
-        },
-        {
-            "company": "Global Digital Baba",
-            "location": "Torino, Italy",
-            "role": "Customer Support & Store Operations",
-            "period": "Apr 2024 - Jan 2025",
-            "description": "Assisted customers with product selection, troubleshooting, and after-sales support while managing billing, merchandising, and stock control.",
-            "skills": ["Customer Service", "Operations", "Inventory Management"]
-        },
-        {
-            "company": "NETWAY INDIA PVT. LTD",
-            "location": "New Delhi, India",
-            "role": "Data Analytics & Business Intelligence",
-            "period": "May 2019 - May 2023",
-            "description": "Conducted data cleaning, mining, and analysis. Developed interactive dashboards and automated reports using Power BI, Python, SQL, and Excel to enable data-driven business decisions. Led end-to-end analytics projects from requirements gathering to deployment.",
-            "skills": ["Python", "SQL", "Power BI", "Excel", "Data Analysis"]
-        },
-        {
-            "company": "AUTHENZA MEDIA INFOTECH PVT. LTD",
-            "location": "Kolkata, India",
-            "role": "Data Analyst",
-            "period": "Sep 2016 - Feb 2019",
-            "description": "Performed data analysis, visualization, and reporting for business operations while ensuring data integrity and developing dashboards to support management insights.",
-            "skills": ["Data Analysis", "SQL", "Excel", "Reporting"]
-        }
-    ]
 
-    for exp in experiences:
-        st.markdown(f"""
+def render_experience(exp: dict) -> str:
+    return f"""
             <div class="timeline-card">
                 <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;">
                     <div>
-                        <h4 style="margin: 0;" class="gradient-text">{exp['role']}</h4>
-                        <p style="margin: 0.5rem 0; font-weight: 700; font-size: 1rem; color: var(--accent1);">{exp['company']}</p>
+                        <h4 style="margin: 0;" class="gradient-text">{escape(exp['role'])}</h4>
+                        <p style="margin: 0.5rem 0; font-weight: 700; font-size: 1rem; color: var(--accent1);">{escape(exp['company'])}</p>
                     </div>
                     <div style="text-align: right;">
-                        <p style="margin: 0; font-weight: 600; font-size: 0.9rem; color: var(--muted);">{exp['period']}</p>
-                        <p style="margin: 0.25rem 0; font-size: 0.85rem; color: var(--muted);">📍 {exp['location']}</p>
+                        <p style="margin: 0; font-weight: 600; font-size: 0.9rem; color: var(--muted);">{escape(exp['period'])}</p>
+                        <p style="margin: 0.25rem 0; font-size: 0.85rem; color: var(--muted);">📍 {escape(exp['location'])}</p>
                     </div>
                 </div>
                 <p style="color: var(--text); line-height: 1.7; margin: 1rem 0;">
-                    {exp['description']}
+                    {escape(exp['description'])}
                 </p>
                 <div>
-                    {''.join([f'<span class="skill-badge">{skill}</span>' for skill in exp['skills']])}
+                    {render_badges(exp['skills'])}
                 </div>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
-with tab3:
-    col1, col2 = st.columns(2)
 
-    with col1:
-        st.markdown("## 🎓 Education")
-
-        st.markdown("""
-            <div class="timeline-card">
-                <h4 style="margin: 0;" class="gradient-text">Professional Master's in Artificial Intelligence and Machine Learning Engineer(AI Specialist)</h4>
-                <p style="margin: 0.75rem 0; font-weight: 700; color: var(--accent1);">INFOR ELEA Smart Business Academy</p>
-                <p style="color: var(--muted); font-size: 0.9rem;">📍 Torino, Italy | 🗓️ Oct 2025 - Present</p>
-            </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown("""
-            <div class="timeline-card">
-                <h4 style="margin: 0;" class="gradient-text">Web Development Specialization</h4>
-                <p style="margin: 0.75rem 0; font-weight: 700; color: var(--accent1);">Forte Chance ETS</p>
-                <p style="color: var(--muted); font-size: 0.9rem;">📍 Torino, Italy | 🗓️ Feb 2025 - Aug 2025 | Grade: A</p>
+def render_education(edu: dict) -> str:
+    meta = f"📍 {escape(edu['location'])} | 🗓️ {escape(edu['period'])}"
+    if edu["grade"]:
+        meta += f" | Grade: {escape(edu['grade'])}"
+    details = ""
+    if edu["details"]:
+        details = f"""
                 <p style="color: var(--text); font-size: 0.9rem; margin-top: 1rem; line-height: 1.6;">
-                    PHP, HTML, CSS, Bootstrap, JavaScript, WordPress, SQL, Apache, Cyber Security, Prompt Engineering
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown("""
+                    {escape(edu['details'])}
+                </p>"""
+    return f"""
             <div class="timeline-card">
-                <h4 style="margin: 0;" class="gradient-text">Bachelor of Computer Applications (BCA)</h4>
-                <p style="margin: 0.75rem 0; font-weight: 700; color: var(--accent1);">IGNOU (Indira Gandhi National Open University)</p>
-                <p style="color: var(--muted); font-size: 0.9rem;">📍 New Delhi, India | 🗓️ 2012 - 2015 | Grade: B</p>
-                <p style="color: var(--text); font-size: 0.9rem; margin-top: 1rem; line-height: 1.6;">
-                    Foundation Course in English for Computing, Computer Fundamentals and PC Software, PC Software Application Skills,
-                    Foundation Course in Mathematics and Computing, C Programming & Data Structure, Introduction to System Software, Elements
-                    of System Analysis and Design, Introduction to DBMS, Introduction to Computer Organization, Window Programming, Multimedia,
-                    Computer Networks, TCP/IP Programming, Introduction to Software Engineering, Computer Oriented Numerical Techniques, C++
-                    and Object Oriented Programming, Theory of Computer Science, Introduction to Internet Programming Java, Intranet
-                    Administration, SQL, HTML,CSS, Project, etc.
-                </p>
+                <h4 style="margin: 0;" class="gradient-text">{escape(edu['degree'])}</h4>
+                <p style="margin: 0.75rem 0; font-weight: 700; color: var(--accent1);">{escape(edu['school'])}</p>
+                <p style="color: var(--muted); font-size: 0.9rem;">{meta}</p>{details}
             </div>
-        """, unsafe_allow_html=True)
+        """
 
-    with col2:
-        st.markdown("## 💻 Technical Skills")
-
-        skills_data = {
-            "Data Science & AI": ["Python", "Machine Learning", "Pandas", "NumPy", "Scikit-learn", "Feature Engineering", "Deep Learning", "LLM", "N8N"],
-            "Data Analytics": ["SQL", "Power BI", "Excel (Advanced)", "Data Visualization", "Statistical Analysis"],
-            "Web Development": ["PHP", "JavaScript", "HTML/CSS", "Bootstrap", "WordPress", "Django"],
-            "Databases": ["MySQL", "SQL Server", "Database Design"],
-            "Tools & DevOps": ["Git", "Apache", "Streamlit", "VS Code", "Linux"],
-            "Soft Skills": ["Problem Solving", "Team Collaboration", "Project Management", "Analytical Thinking"]
-        }
 
-        for category, skills in skills_data.items():
-            st.markdown(f"""
+def render_skill_category(group: dict) -> str:
+    return f"""
                 <div class="glass-card" style="margin-bottom: 1.5rem;">
-                    <h5 class="gradient-text" style="margin-bottom: 1rem;">{category}</h5>
+                    <h5 class="gradient-text" style="margin-bottom: 1rem;">{escape(group['category'])}</h5>
                     <div>
-                        {''.join([f'<span class="skill-badge">{skill}</span>' for skill in skills])}
+                        {render_badges(group['skills'])}
                     </div>
                 </div>
-            """, unsafe_allow_html=True)
-
-with tab4:
-    st.markdown("## 👋 About Me")
-
-    st.markdown("""
-        <div class="glass-card">
-            <p style="color: var(--text); font-size: 1.05rem; line-height: 1.8;">
-                I am a <strong class="gradient-text">Senior Data Analyst and Full-Stack Web Developer</strong> with over 8+ years of hands-on experience
-                delivering production-grade analytics platforms and ML/AI-enabled solutions. I have deep expertise in
-                <strong>Python, SQL, PHP, Power BI, Excel, and JavaScript</strong>, with a strong background in data modeling,
-                feature engineering, dashboarding, and automation.
-            </p>
-            <p style="color: var(--text); font-size: 1.05rem; line-height: 1.8; margin-top: 1.5rem;">
-                Throughout my career, I have proven my ability to translate business requirements into scalable data products
-                and intelligent web applications, leading projects end-to-end from architecture to deployment.
-            </p>
-            <p style="color: var(--text); font-size: 1.05rem; line-height: 1.8; margin-top: 1.5rem;">
-                Currently pursuing a <strong class="gradient-text">Professional Master's Program in Artificial Intelligence and Machine Learning Engineer</strong>,
-                strengthening my expertise in machine learning, feature engineering, and applied AI systems.
-            </p>
+            """
+
+
+def render_about(content: dict) -> str:
+    paragraphs = []
+    for i, paragraph in enumerate(content["about"]["paragraphs_html"]):
+        spacing = " margin-top: 1.5rem;" if i else ""
+        paragraphs.append(f"""
+            <p style="color: var(--text); font-size: 1.05rem; line-height: 1.8;{spacing}">
+                {paragraph}
+            </p>""")
+    return f"""
+        <div class="glass-card">{''.join(paragraphs)}
         </div>
-    """, unsafe_allow_html=True)
+    """
 
-    st.markdown("## 🎯 Career Goals & Interests")
 
-    colA, colB = st.columns(2)
-
-    with colA:
-        st.markdown("""
+def render_focus(content: dict) -> str:
+    return f"""
             <div class="featured-project project-card">
-                <h4 style="margin-bottom: 1.5rem;">Current Focus</h4>
+                <h4 style="margin-bottom: 1.5rem;">{escape(content['labels']['current_focus'])}</h4>
                 <p style="line-height: 1.8; opacity: 0.95;">
-                    Actively pursuing roles in <strong>AI Engineering, Data Science,</strong> and
-                    <strong>Machine Learning Engineering</strong> where I can leverage my unique combination of
-                    analytics expertise and full-stack development skills to build intelligent,
-                    production-ready solutions.
+                    {content['about']['focus_html']}
                 </p>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
-    with colB:
-        st.markdown("""
+
+def render_interests(content: dict) -> str:
+    items = "<br><br>\n".join(
+        f"{escape(item['icon'])} <strong>{escape(item['title'])}</strong><br>\n{escape(item['detail'])}"
+        for item in content["about"]["interests"]
+    )
+    return f"""
             <div class="glass-card">
-                <h4 style="margin-bottom: 1.5rem;">Interests & Hobbies</h4>
+                <h4 style="margin-bottom: 1.5rem;">{escape(content['labels']['interests'])}</h4>
                 <p style="color: var(--text); line-height: 1.8;">
-                    📚 <strong>Reading & Self-Learning</strong><br>
-                    Technology, Business, Personal Development<br><br>
-                    🤖 <strong>AI & ML Research</strong><br>
-                    Staying updated with latest trends<br><br>
-                    💻 <strong>Coding Projects</strong><br>
-                    Building practical solutions<br><br>
-                    🌍 <strong>Languages</strong><br>
-                    Learning Italian (currently B2 level)
+                    {items}
                 </p>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
-# ---------------------------
-# FOOTER
-# ---------------------------
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("""
+
+def render_footer(content: dict) -> str:
+    footer = content["footer"]
+    return f"""
     <div class="hero-glass" style="text-align: center;">
-        <h2 style="margin-bottom: 1rem;">Let's Connect 🤝</h2>
+        <h2 style="margin-bottom: 1rem;">{escape(footer['heading'])}</h2>
         <p style="font-size: 1.1rem; margin-bottom: 2rem; opacity: 0.9;">
-            I'm always open to discussing new opportunities, collaborations, or innovative projects
+            {escape(footer['text'])}
         </p>
         <div style="margin-bottom: 1.5rem; font-size: 2rem;">
-            📧 📱 💼
+            {escape(footer['icons'])}
         </div>
-        <p style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.5rem;">rajaroybca6@gmail.com</p>
-        <p style="font-size: 1.1rem; font-weight: 600;">+39 388 381 8145</p>
+        <p style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.5rem;">{escape(footer['email'])}</p>
+        <p style="font-size: 1.1rem; font-weight: 600;">{escape(footer['phone'])}</p>
         <p style="opacity: 0.7; font-size: 0.85rem; margin-top: 2rem; letter-spacing: 0.2em;">
-            RAJA ROY — AI ENGINEER & DATA SCIENTIST — PORTFOLIO 2026
+            {escape(footer['tagline'])}
         </p>
     </div>
-""", unsafe_allow_html=True)
-# streamlit run My_Cv.py
\ No newline at end of file
+"""
+
+
+def render_cv_link(content: dict, url: str) -> str:
+    filename = os.path.basename(content["profile"]["cv"])
+    return (
+        f'<a class="cv-download" href="{escape(url)}" download="{escape(filename)}"{ping_attr("cv_downloaded")}>'
+        f'{escape(content["labels"]["download_cv"])}</a>'
+    )
+
+
+# ---------------------------
+# FRAGMENT CACHE
+# ---------------------------
+SECTION_RENDERERS = {
+    "sidebar": lambda c: (render_contact(c), render_languages(c), render_current_study(c)),
+    "hero": lambda c: (render_hero(c),),
+    "stats": lambda c: tuple(render_stat(stat) for stat in c["stats"]),
+    "projects": lambda c: (
+        tuple(render_featured_project(p, c["labels"]) for p in c["featured_projects"])
+        + tuple(render_web_project(p) for p in c["web_projects"])
+    ),
+    "experience": lambda c: tuple(render_experience(exp) for exp in c["experience"]),
+    "education": lambda c: tuple(render_education(edu) for edu in c["education"]),
+    "skills": lambda c: tuple(render_skill_category(group) for group in c["skills"]),
+    "about": lambda c: (render_about(c), render_focus(c), render_interests(c)),
+    "footer": lambda c: (render_footer(c),),
+}
+
+
+def fragment_size(value) -> int:
+    """UTF-8 size of a fragment (a string or nested tuples of strings)."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return sum(fragment_size(item) for item in value)
+
+
+class FragmentCache:
+    """Thread-safe LRU of rendered section fragments with per-section stats.
+
+    Keys are ``(section, theme, content_version)``; values are the tuples of
+    HTML blocks returned by SECTION_RENDERERS, or the per-version tag index
+    and markup optimizer (keyed ``("tag_index" | "markup", "", version)``),
+    so everything built per profile and locale shares one LRU and counts
+    against PROFILE_MEMORY_BUDGET.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._stats = {}  # section -> {"hits", "misses"}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, build, size=fragment_size):
+        section = key[0]
+        with self._lock:
+            counters = self._stats.setdefault(section, {"hits": 0, "misses": 0})
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                counters["hits"] += 1
+                return entry[0]
+            counters["misses"] += 1
+
+        value = build()
+
+        with self._lock:
+            self._entries[key] = (value, size(value))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def resident(self, owns) -> tuple:
+        """``(entries, bytes)`` cached for the keys ``owns(key)`` accepts."""
+        with self._lock:
+            sizes = [size for key, (_, size) in self._entries.items() if owns(key)]
+            return len(sizes), sum(sizes)
+
+    def evict(self, owns) -> int:
+        """Drop the entries whose key ``owns`` accepts; returns bytes freed."""
+        with self._lock:
+            keys = [key for key in self._entries if owns(key)]
+            return sum(self._entries.pop(key)[1] for key in keys)
+
+    def stats(self) -> dict:
+        """Per-section hit rate and the bytes currently cached for it."""
+        with self._lock:
+            report = {}
+            for section, counters in self._stats.items():
+                total = counters["hits"] + counters["misses"]
+                report[section] = {
+                    **counters,
+                    "hit_rate": counters["hits"] / total if total else 0.0,
+                    "entries": sum(1 for key in self._entries if key[0] == section),
+                    "bytes": sum(size for key, (_, size) in self._entries.items() if key[0] == section),
+                }
+            return report
+
+
+@st.cache_resource
+def get_fragment_cache() -> FragmentCache:
+    """One fragment cache per process, shared across sessions and reruns."""
+    return FragmentCache(FRAGMENT_CACHE_MAX_ENTRIES)
+
+
+def get_section(section: str, content: dict, version: str, theme: str):
+    """Rendered (and optimized) HTML blocks for a page section, built once per key."""
+    def build():
+        blocks = SECTION_RENDERERS[section](content)
+        if HTML_OPTIMIZE:
+            blocks = compile_markup_optimizer(version, content).optimize(section, blocks)
+        return blocks
+
+    return get_fragment_cache().get((section, theme, version), build)
+
+
+# ---------------------------
+# TAG INDEX
+# ---------------------------
+FACETS = ("technology", "domain", "year")
+# "Python & Streamlit" and "NumPy · SciPy" each name two technologies.
+TECH_SEPARATOR_RE = re.compile(r"\s+[&·]\s+")
+
+
+def tag_key(tag: str) -> str:
+    return " ".join(tag.lower().split())
+
+
+def period_years(period: str) -> list:
+    """Years a period such as "May 2019 - May 2023" or "Oct 2025 - Present" spans."""
+    years = [int(year) for year in re.findall(r"\b(?:19|20)\d{2}\b", period)]
+    if years and re.search(r"\bpresent\b", period, re.I):
+        years.append(datetime.now().year)
+    return list(range(min(years), max(years) + 1)) if years else []
+
+
+class TagIndex:
+    """Inverted index from facet tags to cards, stored as integer bitsets.
+
+    Cards are featured projects, web projects and experience entries, keyed
+    ``(kind, position)``; bit ``i`` of a tag's mask is set when card ``i``
+    carries the tag. Technologies come from a card's tech/skills (split on
+    " & " and " · "), domains from the skills categories naming those
+    technologies (or an explicit ``domains`` list) and years from its
+    ``period``. Cards without a period (the projects, unless given one) are
+    never excluded by a year filter. Tags are matched case-insensitively and
+    shown with their spelling in the skills data, if listed there.
+    Resolving a selection costs one OR per selected tag and one AND per
+    facet.
+    """
+
+    def __init__(self, content: dict):
+        self.bits = {}  # (kind, position) -> bit
+        self.masks = {facet: {} for facet in FACETS}  # facet -> {tag key: mask}
+        self.names = {facet: {} for facet in FACETS}  # facet -> {tag key: display name}
+        self.spellings = {tag_key(skill): skill for group in content["skills"] for skill in group["skills"]}
+        self.undated = 0  # cards without years
+        categories = [
+            (group["category"], [re.compile(rf"(?<!\w){re.escape(tag_key(skill))}(?!\w)") for skill in group["skills"]])
+            for group in content["skills"]
+        ]
+        cards = (
+            [("featured", project, project["tech"]) for project in content["featured_projects"]]
+            + [("web", project, project["tech"]) for project in content["web_projects"]]
+            + [("experience", job, job["skills"]) for job in content["experience"]]
+        )
+        domains_of = {}  # tech key -> skills categories naming it
+        positions = {}
+        for kind, item, tags in cards:
+            position = positions[kind] = positions.get(kind, -1) + 1
+            bit = 1 << len(self.bits)
+            self.bits[(kind, position)] = bit
+            technologies = [
+                " ".join(part.split()) for tag in tags for part in TECH_SEPARATOR_RE.split(tag) if part.strip()
+            ]
+            for tech in technologies:
+                key = tag_key(tech)
+                if key not in domains_of:
+                    domains_of[key] = [
+                        category for category, patterns in categories
+                        if any(pattern.search(key) for pattern in patterns)
+                    ]
+            domains = item.get("domains") or list(dict.fromkeys(
+                category for tech in technologies for category in domains_of[tag_key(tech)]
+            ))
+            self._add("technology", technologies, bit)
+            self._add("domain", domains, bit)
+            years = period_years(item.get("period", ""))
+            self._add("year", [str(year) for year in years], bit)
+            if not years:
+                self.undated |= bit
+        self.all = (1 << len(self.bits)) - 1
+
+    def _add(self, facet: str, tags, bit: int):
+        for tag in tags:
+            key = tag_key(tag)
+            self.masks[facet][key] = self.masks[facet].get(key, 0) | bit
+            self.names[facet].setdefault(key, self.spellings.get(key, tag))
+
+    def options(self, facet: str) -> list:
+        """Display names of a facet's tags, busiest first (newest first for years)."""
+        if facet == "year":
+            return sorted(self.names[facet].values(), reverse=True)
+        names = self.names[facet]
+        return [names[key] for key in sorted(names, key=lambda key: (-self.masks[facet][key].bit_count(), key))]
+
+    def match(self, selection: dict) -> int:
+        """Mask of the cards having any selected tag of every filtered facet."""
+        mask = self.all
+        for facet, tags in selection.items():
+            if tags:
+                facet_mask = 0
+                for tag in tags:
+                    facet_mask |= self.masks[facet].get(tag_key(tag), 0)
+                if facet == "year":
+                    facet_mask |= self.undated
+                mask &= facet_mask
+        return mask
+
+    def shows(self, mask: int, kind: str, position: int) -> bool:
+        return bool(mask & self.bits[(kind, position)])
+
+    def size(self) -> int:
+        """Approximate bytes held, for the memory budget."""
+        masks = sum(len(key) + sys.getsizeof(mask) for tags in self.masks.values() for key, mask in tags.items())
+        names = sum(len(name.encode("utf-8")) for tags in self.names.values() for name in tags.values())
+        return masks + names + sum(sys.getsizeof(bit) for bit in self.bits.values())
+
+
+def compile_tag_index(version: str, content: dict) -> TagIndex:
+    """One tag index per content version, shared across sessions."""
+    return get_fragment_cache().get(("tag_index", "", version), lambda: TagIndex(content), TagIndex.size)
+
+
+# ---------------------------
+# MARKUP OPTIMIZATION
+# ---------------------------
+TAG_RE = re.compile(r"<[a-zA-Z][^>]*>")
+STYLE_ATTR_RE = re.compile(r'\sstyle="([^"]*)"')
+CLASS_ATTR_RE = re.compile(r'\sclass="([^"]*)"')
+# Whitespace next to these tags never renders, so it can be dropped.
+BLOCK_TAG_SPACE_RE = re.compile(
+    r"\s*(</?(?:div|p|h[1-6]|ul|ol|li|br|hr|section|header|footer|table|thead|tbody|tr|td|th)\b[^>]*>)\s*"
+)
+
+
+def normalize_style(style: str) -> str:
+    """Minified declarations of an inline style, in their original order."""
+    declarations = []
+    for declaration in style.split(";"):
+        prop, sep, value = declaration.partition(":")
+        if sep and prop.strip():
+            declarations.append(f"{prop.strip()}:{' '.join(value.split())}")
+    return ";".join(declarations)
+
+
+def map_blocks(value, fn):
+    """Apply ``fn`` to every HTML string in a fragment (nested tuples)."""
+    if isinstance(value, str):
+        return fn(value)
+    return tuple(map_blocks(item, fn) for item in value)
+
+
+def iter_blocks(value):
+    if isinstance(value, str):
+        yield value
+    else:
+        for item in value:
+            yield from iter_blocks(item)
+
+
+def minify_html(html: str) -> str:
+    """Collapse whitespace runs, dropping those around block-level tags."""
+    return BLOCK_TAG_SPACE_RE.sub(r"\1", re.sub(r"\s+", " ", html)).strip()
+
+
+class MarkupOptimizer:
+    """Post-processing for rendered sections of one content version.
+
+    Inline styles used at least LIFT_STYLE_MIN_USES times across all
+    sections become generated ``cvs<n>`` classes (see ``css``); the rest,
+    and any style with its own ``!important``, are minified in place.
+    Every block is then whitespace-minified, and its size before and
+    after is kept per section for ``report``.
+    """
+
+    def __init__(self, content: dict):
+        uses = {}
+        for render in SECTION_RENDERERS.values():
+            for html in iter_blocks(render(content)):
+                for style in STYLE_ATTR_RE.findall(html):
+                    style = normalize_style(style)
+                    uses[style] = uses.get(style, 0) + 1
+        # An inline !important beats every stylesheet rule, which no class
+        # can match (e.g. the demo link's colour under ``.featured-project *``),
+        # so those styles stay inline.
+        lifted = sorted(
+            style for style, count in uses.items()
+            if count >= LIFT_STYLE_MIN_USES and style and "!important" not in style
+        )
+        self.classes = {style: f"cvs{index:x}" for index, style in enumerate(lifted)}
+        # !important keeps the inline styles' precedence over Streamlit's
+        # rules; emitted before the main stylesheet, whose !important rules
+        # (all at least as specific as a class) still win as they did over
+        # the inline styles.
+        self.css = "".join(
+            f".{name}{{{';'.join(d + '!important' for d in style.split(';'))}}}"
+            for style, name in self.classes.items()
+        )
+        self._sizes = {}  # section -> (raw bytes, optimized bytes)
+        self._lock = threading.Lock()
+
+    def _lift(self, match) -> str:
+        tag = match.group(0)
+        style = STYLE_ATTR_RE.search(tag)
+        if not style:
+            return tag
+        css = normalize_style(style.group(1))
+        name = self.classes.get(css)
+        if not name:
+            return f'{tag[:style.start()]} style="{css}"{tag[style.end():]}' if css else tag[:style.start()] + tag[style.end():]
+        tag = tag[:style.start()] + tag[style.end():]
+        existing = CLASS_ATTR_RE.search(tag)
+        if existing:
+            return f'{tag[:existing.start()]} class="{existing.group(1)} {name}"{tag[existing.end():]}'
+        return re.sub(r"^<([a-zA-Z0-9]+)", rf'<\1 class="{name}"', tag)
+
+    def optimize_html(self, html: str) -> str:
+        return minify_html(TAG_RE.sub(self._lift, html))
+
+    def optimize(self, section: str, blocks):
+        """Optimized copy of a section's blocks, recording the size change."""
+        optimized = map_blocks(blocks, self.optimize_html)
+        with self._lock:
+            self._sizes[section] = (fragment_size(blocks), fragment_size(optimized))
+        return optimized
+
+    def size(self) -> int:
+        """Approximate bytes held, for the memory budget."""
+        return len(self.css) + sum(len(style) + len(name) for style, name in self.classes.items())
+
+    def stylesheet(self) -> str:
+        digest = hashlib.sha256(self.css.encode("utf-8")).hexdigest()[:12]
+        return f'<style id="portfolio-markup-{digest}">{self.css}</style>'
+
+    def report(self) -> list:
+        """Per-section bytes before and after, for sections optimized so far."""
+        with self._lock:
+            sizes = dict(self._sizes)
+        rows = [
+            {"section": section, "raw_bytes": raw, "bytes": size, "saved": f"{1 - size / raw:.0%}" if raw else "0%"}
+            for section, (raw, size) in sizes.items()
+        ]
+        raw_total = sum(row["raw_bytes"] for row in rows)
+        size_total = sum(row["bytes"] for row in rows) + len(self.css)
+        rows.append({
+            "section": "total (incl. generated CSS)",
+            "raw_bytes": raw_total,
+            "bytes": size_total,
+            "saved": f"{1 - size_total / raw_total:.0%}" if raw_total else "0%",
+        })
+        return rows
+
+
+def compile_markup_optimizer(version: str, content: dict) -> MarkupOptimizer:
+    """One optimizer per content version, shared across sessions."""
+    return get_fragment_cache().get(("markup", "", version), lambda: MarkupOptimizer(content), MarkupOptimizer.size)
+
+
+def get_markup_stylesheet(content: dict, version: str) -> str:
+    """<style> with the generated classes, or "" when optimization is off."""
+    if not HTML_OPTIMIZE:
+        return ""
+    return compile_markup_optimizer(version, content).stylesheet()
+
+
+# ---------------------------
+# PROFILES
+# ---------------------------
+def percentile(values, fraction: float):
+    """Nearest-rank percentile of ``values`` (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ProfileRegistry:
+    """Per-profile visits, render times and cache residency.
+
+    Profiles are kept in least-recently-visited order. ``enforce_budget``
+    drops every cached asset and fragment (including tag indexes and markup
+    optimizers) of the coldest profiles until the asset and fragment caches
+    together fit in ``budget`` bytes, and forgets the evicted profiles'
+    content versions; the profile being served is never evicted, and files
+    shared by all profiles (styles, static files) are left to the asset
+    cache's own LRU.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self._profiles = OrderedDict()  # profile -> metrics
+        self._version_owner = {}  # content version -> profile
+        self._lock = threading.Lock()
+
+    def visit(self, profile: str, version: str):
+        """Mark ``profile`` most recently used and remember its content version."""
+        with self._lock:
+            entry = self._profiles.pop(profile, None) or {
+                "renders": 0, "render_ms": deque(maxlen=200), "evictions": 0, "last_seen": None,
+            }
+            self._profiles[profile] = entry
+            self._version_owner[version] = profile
+
+    def record_render(self, profile: str, ms: float):
+        with self._lock:
+            entry = self._profiles[profile]
+            entry["renders"] += 1
+            entry["render_ms"].append(ms)
+            entry["last_seen"] = time.time()
+
+    def owner(self, path: str):
+        """Profile a cached file belongs to, or None for shared files."""
+        if path.startswith(PROFILES_DIR + os.sep):
+            return os.path.relpath(path, PROFILES_DIR).split(os.sep)[0]
+        if path.startswith(CV_BUILD_DIR + os.sep):
+            match = re.fullmatch(r"cv-(.+)-v\d+\.pdf", os.path.basename(path))
+            return self._version_owner.get(match.group(1)) if match else None
+        if path.startswith((STYLES_DIR + os.sep, STATIC_DIR + os.sep, PHOTO_BUILD_DIR + os.sep)):
+            return None
+        return ""
+
+    def _owns_asset(self, profile: str):
+        return lambda path: self.owner(path) == profile
+
+    def _owns_fragment(self, profile: str):
+        return lambda key: self._version_owner.get(key[2]) == profile
+
+    def enforce_budget(self, current: str) -> int:
+        """Evict the coldest profiles' entries while over budget; returns bytes freed."""
+        assets, fragments = get_asset_cache(), get_fragment_cache()
+
+        def used():
+            return assets.stats()["bytes"] + fragments.resident(lambda key: True)[1]
+
+        freed = 0
+        with self._lock:
+            cold = [profile for profile in self._profiles if profile != current]
+        for profile in cold:
+            if used() <= self.budget:
+                break
+            released = assets.evict(self._owns_asset(profile)) + fragments.evict(self._owns_fragment(profile))
+            with self._lock:
+                # Nothing of theirs is cached any more; a visit registers the version again.
+                for version in [v for v, owner in self._version_owner.items() if owner == profile]:
+                    del self._version_owner[version]
+                if released:
+                    self._profiles[profile]["evictions"] += 1
+            freed += released
+        return freed
+
+    def stats(self, only: str = None) -> dict:
+        """Per-profile render times and what each has resident in the caches.
+
+        With ``only``, the report covers that one profile.
+        """
+        assets, fragments = get_asset_cache(), get_fragment_cache()
+        with self._lock:
+            profiles = {
+                profile: dict(entry, render_ms=list(entry["render_ms"])) for profile, entry in self._profiles.items()
+                if only is None or profile == only
+            }
+        report = {}
+        for profile, entry in reversed(profiles.items()):
+            fragment_entries, fragment_bytes = fragments.resident(self._owns_fragment(profile))
+            report[profile or "(default)"] = {
+                "renders": entry["renders"],
+                "render_ms_p50": percentile(entry["render_ms"], 0.50),
+                "render_ms_p95": percentile(entry["render_ms"], 0.95),
+                "asset_bytes": assets.resident(self._owns_asset(profile)),
+                "fragment_entries": fragment_entries,
+                "fragment_bytes": fragment_bytes,
+                "evictions": entry["evictions"],
+                "last_seen": entry["last_seen"],
+            }
+        return {
+            "budget": self.budget,
+            "used": assets.stats()["bytes"] + fragments.resident(lambda key: True)[1],
+            "profiles": report,
+        }
+
+
+@st.cache_resource
+def get_profile_registry() -> ProfileRegistry:
+    """One profile registry per process, shared across sessions and reruns."""
+    return ProfileRegistry(PROFILE_MEMORY_BUDGET)
+
+
+# ---------------------------
+# PAYLOAD INSTRUMENTATION
+# ---------------------------
+def debug_requested(panel: str) -> bool:
+    """True if this visit asked for ``panel`` with the DEBUG_TOKEN secret."""
+    token = st.query_params.get("token", "")
+    return (
+        bool(DEBUG_TOKEN) and st.query_params.get("debug") == panel
+        and hmac.compare_digest(token.encode("utf-8"), DEBUG_TOKEN.encode("utf-8"))
+    )
+
+
+def payload_debug_enabled() -> bool:
+    return PAYLOAD_DEBUG or debug_requested("payload")
+
+
+def emit(section: str, body: str, html: bool = True):
+    """st.markdown(), logging the element's size and time when debugging."""
+    if not st.session_state.get("payload_debug"):
+        st.markdown(body, unsafe_allow_html=html)
+        return
+    start = time.perf_counter()
+    st.markdown(body, unsafe_allow_html=html)
+    st.session_state.payload_log.append({
+        "section": section,
+        "bytes": len(body.encode("utf-8")),
+        "ms": round((time.perf_counter() - start) * 1000, 3),
+    })
+
+
+def summarize_payload(log: list) -> list:
+    """Per-section element count, bytes and time, heaviest first."""
+    totals = {}
+    for row in log:
+        entry = totals.setdefault(row["section"], {"section": row["section"], "elements": 0, "bytes": 0, "ms": 0.0})
+        entry["elements"] += 1
+        entry["bytes"] += row["bytes"]
+        entry["ms"] = round(entry["ms"] + row["ms"], 3)
+    return sorted(totals.values(), key=lambda entry: entry["bytes"], reverse=True)
+
+
+def payload_report_csv(log: list) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=["section", "bytes", "ms"])
+    writer.writeheader()
+    writer.writerows(log)
+    return out.getvalue()
+
+
+def payload_debug_panel():
+    """Opt-in panel with the payload of the last run plus cache statistics."""
+    log = st.session_state.payload_log
+    summary = summarize_payload(log)
+    with st.expander("🔍 Payload debug", expanded=True):
+        st.caption(f"{len(log)} elements, {sum(row['bytes'] for row in log):,} bytes this run")
+        st.dataframe(summary, width="stretch")
+        with st.popover("Elements"):
+            st.dataframe(log, width="stretch")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("Report (CSV)", payload_report_csv(log), "payload.csv", "text/csv", on_click="ignore")
+        with col2:
+            report = json.dumps({"elements": log, "sections": summary}, indent=2)
+            st.download_button("Report (JSON)", report, "payload.json", "application/json", on_click="ignore")
+        if HTML_OPTIMIZE:
+            st.caption("Markup optimization (bytes per section before and after)")
+            st.dataframe(compile_markup_optimizer(content_version, content).report(), width="stretch")
+        st.json({
+            "fragment_cache": get_fragment_cache().stats(),
+            "asset_cache": get_asset_cache().stats(),
+            "asset_manifest": get_asset_manifest().stats(),
+            "profiles": get_profile_registry().stats(profile),
+        }, expanded=False)
+
+
+# ---------------------------
+# ANALYTICS
+# ---------------------------
+def session_key() -> str:
+    """Short anonymous id of the current browser session."""
+    ctx = get_script_run_ctx()
+    return hashlib.sha256(ctx.session_id.encode()).hexdigest()[:12] if ctx else ""
+
+
+def track(kind: str, profile: str, detail: str = "", session: str = None):
+    """Queue an analytics event; costs a deque append, the write happens later."""
+    if ANALYTICS:
+        analytics.get_writer().record(kind, session_key() if session is None else session, profile, detail)
+
+
+def analytics_dashboard_enabled() -> bool:
+    return ANALYTICS_DASHBOARD or debug_requested("analytics")
+
+
+def analytics_dashboard(profile: str, tab_labels: list):
+    """Opt-in panel with ``profile``'s event totals, daily traffic and most used links."""
+    import pandas as pd
+
+    writer = analytics.get_writer()
+    writer.flush()
+    summary = writer.summary(profile=profile)
+    totals = summary["totals"]
+    with st.expander("📈 Analytics (last 30 days)", expanded=True):
+        cols = st.columns(5)
+        cols[0].metric("Page views", totals.get("page_view", 0))
+        cols[1].metric("Sessions", summary["sessions"])
+        cols[2].metric("Tab selections", totals.get("tab_selected", 0))
+        cols[3].metric("CV downloads", totals.get("cv_downloaded", 0))
+        cols[4].metric("Demo clicks", totals.get("demo_clicked", 0))
+        if summary["daily"]:
+            daily = pd.DataFrame(summary["daily"], columns=["day", "kind", "events"])
+            st.line_chart(daily.pivot(index="day", columns="kind", values="events").fillna(0))
+        tabs = [
+            [tab_labels[int(detail)] if detail.isdigit() and int(detail) < len(tab_labels) else detail, count]
+            for detail, count in summary["top"]["tab_selected"]
+        ]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.caption("Tabs selected")
+            st.dataframe(pd.DataFrame(tabs, columns=["tab", "selections"]), width="stretch", hide_index=True)
+        with col2:
+            st.caption("Demo links clicked")
+            st.dataframe(
+                pd.DataFrame(summary["top"]["demo_clicked"], columns=["link", "clicks"]), width="stretch", hide_index=True
+            )
+        st.json({"queue": writer.stats()}, expanded=False)
+
+
+# ---------------------------
+# CV PDF
+# ---------------------------
+# Printable characters only: core PDF fonts are Latin-1, so typographic
+# punctuation is mapped and anything else (emoji, flags) is dropped.
+PDF_TEXT_MAP = str.maketrans({"–": "-", "—": "-", "‘": "'", "’": "'", "“": '"', "”": '"', "•": "·", "→": "->", "…": "..."})
+PDF_ACCENT = (102, 126, 234)  # --accent1
+PDF_MUTED = (107, 114, 128)  # --muted
+
+
+def pdf_text(value: str) -> str:
+    """Plain Latin-1 text for the PDF from a content string (HTML allowed)."""
+    text = unescape(re.sub(r"<[^>]+>", "", value)).translate(PDF_TEXT_MAP)
+    text = text.encode("latin-1", "ignore").decode("latin-1")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def render_cv_pdf(content: dict) -> bytes:
+    """Two-page A4 CV rendered from the same content as the page."""
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
+    labels = content["labels"]
+    profile = content["profile"]
+    pdf = FPDF(format="A4")
+    pdf.set_margins(18, 16, 18)
+    pdf.set_auto_page_break(True, margin=16)
+    pdf.set_title(pdf_text(f"{profile['name']} - CV"))
+    pdf.set_author(pdf_text(profile["name"]))
+    # A fixed date keeps the output identical for identical content.
+    pdf.set_creation_date(datetime(2000, 1, 1, tzinfo=timezone.utc))
+    pdf.add_page()
+    next_line = {"new_x": XPos.LMARGIN, "new_y": YPos.NEXT}
+
+    def heading(label):
+        pdf.ln(3)
+        pdf.set_font("Helvetica", "B", 12)
+        pdf.set_text_color(*PDF_ACCENT)
+        pdf.cell(0, 7, pdf_text(label).upper(), **next_line)
+        pdf.set_draw_color(*PDF_ACCENT)
+        pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
+        pdf.ln(2)
+        pdf.set_text_color(0, 0, 0)
+
+    def entry(title, right, subtitle="", body="", footnote=""):
+        top = pdf.get_y()
+        pdf.set_font("Helvetica", "", 9)
+        pdf.set_text_color(*PDF_MUTED)
+        pdf.set_x(pdf.l_margin + pdf.epw - 45)
+        pdf.cell(45, 5.5, pdf_text(right), align="R")
+        pdf.set_xy(pdf.l_margin, top)
+        pdf.set_font("Helvetica", "B", 10.5)
+        pdf.set_text_color(0, 0, 0)
+        pdf.multi_cell(pdf.epw - 47, 5.5, pdf_text(title), align="L", **next_line)
+        pdf.set_text_color(*PDF_MUTED)
+        pdf.set_font("Helvetica", "", 9)
+        if subtitle:
+            pdf.cell(0, 5, pdf_text(subtitle), **next_line)
+        pdf.set_text_color(0, 0, 0)
+        if body:
+            pdf.set_font("Helvetica", "", 9.5)
+            pdf.multi_cell(0, 4.6, pdf_text(body), **next_line)
+        if footnote:
+            pdf.set_font("Helvetica", "I", 8.5)
+            pdf.set_text_color(*PDF_MUTED)
+            pdf.multi_cell(0, 4.4, pdf_text(footnote), **next_line)
+            pdf.set_text_color(0, 0, 0)
+        pdf.ln(2)
+
+    pdf.set_font("Helvetica", "B", 22)
+    pdf.cell(0, 10, pdf_text(profile["name"]), **next_line)
+    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_text_color(*PDF_ACCENT)
+    pdf.cell(0, 6, pdf_text(profile["title"]), **next_line)
+    pdf.set_font("Helvetica", "", 9)
+    pdf.set_text_color(*PDF_MUTED)
+    pdf.cell(0, 5, pdf_text("  ·  ".join(item["value"] for item in content["contact"])), **next_line)
+    languages = ", ".join(f"{lang['name']} ({lang['level']})" for lang in content["languages"])
+    pdf.cell(0, 5, pdf_text(f"{labels['languages']}: {languages}"), **next_line)
+    pdf.set_text_color(0, 0, 0)
+
+    heading(labels["about"])
+    pdf.set_font("Helvetica", "", 9.5)
+    pdf.multi_cell(0, 4.6, pdf_text(content["hero"]["summary"]), **next_line)
+
+    heading(labels["experience"])
+    for job in content["experience"]:
+        entry(
+            job["role"], job["period"],
+            subtitle=f"{job['company']}, {job['location']}",
+            body=job["description"],
+            footnote=", ".join(job["skills"]),
+        )
+
+    heading(labels["featured_projects"])
+    for project in content["featured_projects"]:
+        entry(
+            project["title"], "",
+            body=project["description"],
+            footnote=" · ".join(project["tech"]) + f"  -  {project['demo_url']}",
+        )
+
+    heading(labels["education"])
+    for school in content["education"]:
+        grade = f" · Grade {school['grade']}" if school["grade"] else ""
+        entry(
+            school["degree"], school["period"],
+            subtitle=f"{school['school']}, {school['location']}{grade}",
+            footnote=school["details"],
+        )
+
+    heading(labels["skills"])
+    for category in content["skills"]:
+        pdf.set_font("Helvetica", "B", 9.5)
+        pdf.cell(45, 5, pdf_text(category["category"]))
+        pdf.set_font("Helvetica", "", 9.5)
+        pdf.multi_cell(0, 5, pdf_text(", ".join(category["skills"])), **next_line)
+
+    return bytes(pdf.output())
+
+
+class CvPdfBuilder:
+    """Builds CV PDFs into ``build_dir``, one file per content hash.
+
+    ``get`` never blocks: it returns the finished PDF or starts a background
+    build and returns None. Builds of the same hash are shared by every
+    session; only the ``keep`` most recent PDFs of each profile and locale
+    are kept on disk.
+    """
+
+    def __init__(self, build_dir: str, keep: int = 4):
+        self.build_dir = build_dir
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._building = {}  # key -> Thread
+        self._current = {}  # group -> key last asked for, i.e. the one pages link to
+        self.errors = {}  # key -> message of the failed build
+        self.builds = 0
+        self.last_build_ms = None
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.build_dir, f"cv-{key}.pdf")
+
+    @staticmethod
+    def group(key: str) -> str:
+        """Profile and locale part of a build key ("" for the default content)."""
+        match = re.fullmatch(r"(?:(.+)-)?[0-9a-f]{12}-v\d+", key)
+        return (match.group(1) or "") if match else key
+
+    def get(self, content: dict, key: str):
+        """Path of the PDF for ``key``, or None while it is being built."""
+        path = self.path(key)
+        with self._lock:
+            self._current[self.group(key)] = key
+        if os.path.exists(path):
+            return path
+        with self._lock:
+            if key not in self._building and key not in self.errors:
+                thread = threading.Thread(
+                    target=self._build_in_background, args=(content, key), name=f"cv-pdf-{key}", daemon=True
+                )
+                self._building[key] = thread
+                thread.start()
+        return None
+
+    def build(self, content: dict, key: str) -> str:
+        """Build the PDF for ``key`` now (if missing) and return its path."""
+        path = self.path(key)
+        if os.path.exists(path):
+            return path
+        start = time.perf_counter()
+        data = render_cv_pdf(content)
+        os.makedirs(self.build_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self.builds += 1
+            self.last_build_ms = (time.perf_counter() - start) * 1000
+        self._prune()
+        return path
+
+    def _build_in_background(self, content: dict, key: str):
+        try:
+            self.build(content, key)
+        except Exception as e:
+            print(f"Error building CV PDF: {e}")
+            with self._lock:
+                self.errors[key] = str(e)
+        finally:
+            with self._lock:
+                self._building.pop(key, None)
+
+    def _prune(self):
+        """Drop all but the ``keep`` most recently built PDFs of each group.
+
+        The PDF a group's pages currently link to is never dropped, even if
+        it is older (content reverted to an earlier version): deleting a
+        build also deletes its published copy (see AssetManifest.prune).
+        """
+        try:
+            groups = {}
+            for name in os.listdir(self.build_dir):
+                match = re.fullmatch(r"cv-([\w-]+)\.pdf", name)
+                if match:
+                    groups.setdefault(self.group(match.group(1)), []).append(os.path.join(self.build_dir, name))
+            with self._lock:
+                current = {self.path(key) for key in self._current.values()}
+            for built in groups.values():
+                built.sort(key=os.path.getmtime, reverse=True)
+                for path in built[self.keep:]:
+                    if path not in current:
+                        os.remove(path)
+        except OSError as e:
+            print(f"Error pruning CV builds: {e}")
+
+
+@st.cache_resource
+def get_cv_builder() -> CvPdfBuilder:
+    """One CV builder per process, shared across sessions and reruns."""
+    return CvPdfBuilder(CV_BUILD_DIR)
+
+
+def cv_build_key(content_version: str) -> str:
+    return f"{content_version}-v{CV_PDF_LAYOUT}"
+
+
+def get_cv_file(content: dict, content_version: str, wait: bool = False) -> str:
+    """CV to serve: the generated PDF once built, else the committed file.
+
+    With ``wait`` the PDF is built in the calling thread (for the export).
+    """
+    if CV_SOURCE == "generated":
+        builder, key = get_cv_builder(), cv_build_key(content_version)
+        try:
+            path = builder.build(content, key) if wait else builder.get(content, key)
+        except ImportError:
+            path = None
+        if path:
+            return path
+    return content["profile"]["cv"]
+
+
+# ---------------------------
+# FRAUD DEMO
+# ---------------------------
+# pandas and scikit-learn are imported inside these functions so they only
+# load once a visitor opens the demo.
+FRAUD_FEATURES = ["amount", "hour", "distance_km", "merchant_risk", "card_age_days", "foreign", "tx_last_hour"]
+
+
+def synthetic_transactions(rows: int, seed: int = 7):
+    """Random card transactions with an ``is_fraud`` label, as a DataFrame."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "amount": rng.lognormal(3.5, 1.1, rows).round(2),
+        "hour": rng.integers(0, 24, rows),
+        "distance_km": rng.exponential(20, rows).round(1),
+        "merchant_risk": rng.beta(2, 8, rows).round(3),
+        "card_age_days": rng.integers(1, 3650, rows),
+        "foreign": (rng.random(rows) < 0.08).astype(int),
+        "tx_last_hour": rng.poisson(0.6, rows),
+    })
+    logit = (
+        -8.0
+        + 0.7 * np.log1p(data["amount"])
+        + 1.3 * (data["hour"] < 6)
+        + 0.02 * data["distance_km"]
+        + 4.0 * data["merchant_risk"]
+        - 0.0005 * data["card_age_days"]
+        + 1.5 * data["foreign"]
+        + 0.7 * data["tx_last_hour"]
+    )
+    data["is_fraud"] = (rng.random(rows) < 1 / (1 + np.exp(-logit))).astype(int)
+    return data
+
+
+@st.cache_resource(show_spinner=False)
+def get_fraud_model() -> dict:
+    """Fraud classifier, loaded from FRAUD_MODEL_FILE or trained once per process."""
+    start = time.perf_counter()
+    path = find_app_file(FRAUD_MODEL_FILE) if FRAUD_MODEL_FILE else None
+    if path:
+        import joblib
+
+        model, source, auc = joblib.load(path), os.path.basename(path), None
+    else:
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        from sklearn.metrics import roc_auc_score
+
+        data = synthetic_transactions(60_000)
+        train, test = data.iloc[:48_000], data.iloc[48_000:]
+        model = HistGradientBoostingClassifier(max_iter=150, random_state=7)
+        model.fit(train[FRAUD_FEATURES], train["is_fraud"])
+        auc = roc_auc_score(test["is_fraud"], model.predict_proba(test[FRAUD_FEATURES])[:, 1])
+        source = "gradient boosting trained on 48,000 synthetic transactions"
+    return {"model": model, "source": source, "auc": auc, "ready_ms": (time.perf_counter() - start) * 1000}
+
+
+def fraud_sample_csv() -> bytes:
+    """Unlabelled sample transactions to try the demo with."""
+    return synthetic_transactions(FRAUD_SAMPLE_ROWS, seed=11).drop(columns="is_fraud").to_csv(index=False).encode("utf-8")
+
+
+def score_transactions(model, source, total_bytes: int, on_progress=None):
+    """Score a transactions CSV in chunks of FRAUD_SCORE_CHUNK_ROWS rows.
+
+    Each chunk is scored with one vectorized ``predict_proba`` call;
+    ``on_progress(rows, fraction)`` is called after each. Only running
+    counts and the FRAUD_TOP_ROWS highest-scoring rows are kept, so memory
+    stays at one chunk whatever the upload size. Returns
+    ``{"rows", "flagged", "top", "rate"}``, ``top`` being a DataFrame with
+    ``fraud_probability`` and ``rate`` in rows per second. Raises ValueError
+    if a feature column is missing.
+    """
+    import pandas as pd
+
+    start = time.perf_counter()
+    rows = flagged = 0
+    top = pd.DataFrame(columns=[*FRAUD_FEATURES, "fraud_probability"])
+    for chunk in pd.read_csv(source, chunksize=FRAUD_SCORE_CHUNK_ROWS):
+        missing = [name for name in FRAUD_FEATURES if name not in chunk.columns]
+        if missing:
+            raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+        chunk["fraud_probability"] = model.predict_proba(chunk[FRAUD_FEATURES])[:, 1]
+        rows += len(chunk)
+        flagged += int((chunk["fraud_probability"] >= FRAUD_THRESHOLD).sum())
+        chunk_top = chunk.nlargest(FRAUD_TOP_ROWS, "fraud_probability")
+        top = chunk_top if top.empty else pd.concat([top, chunk_top]).nlargest(FRAUD_TOP_ROWS, "fraud_probability")
+        if on_progress:
+            on_progress(rows, min(source.tell() / total_bytes, 1.0) if total_bytes else 1.0)
+    elapsed = time.perf_counter() - start
+    return {"rows": rows, "flagged": flagged, "top": top, "rate": rows / elapsed if elapsed else 0.0}
+
+
+# ---------------------------
+# DEMO HEALTH
+# ---------------------------
+@st.cache_resource
+def get_demo_health_checker() -> demo_health.DemoHealthChecker:
+    """One health checker per process, shared across sessions and reruns."""
+    return demo_health.DemoHealthChecker()
+
+
+def render_demo_status(result, labels: dict) -> str:
+    state = result["status"] if result else "unknown"
+    title = f"{result['detail']} · {result['latency_ms']} ms" if result else ""
+    return (
+        f'<span class="demo-status demo-{state}" title="{escape(title)}">'
+        f'{escape(labels["demo_status"][state])}</span>'
+    )
+
+
+# ---------------------------
+# PHOTO VARIANTS
+# ---------------------------
+# Pillow is imported inside build_photo_variants, like fpdf2 for the CV.
+PHOTO_ENCODER_OPTIONS = {
+    "avif": {"quality": 60},
+    "webp": {"quality": 80, "method": 6},
+    "png": {"optimize": True},
+}
+
+
+def photo_variant_widths(source_px: int) -> list:
+    """Widths for PHOTO_DISPLAY_PX at 1x and 2x, never above the source."""
+    return sorted({min(px * density, source_px) for px in PHOTO_DISPLAY_PX for density in (1, 2)})
+
+
+def build_photo_variants(source: str, out_dir: str = PHOTO_BUILD_DIR) -> dict:
+    """Resize ``source`` into every PHOTO_FORMATS and return {format: {width: path}}.
+
+    The photo is centre-cropped to a square, as ``object-fit: cover`` shows
+    it, and saved without EXIF, XMP or ICC data. Variants are written to
+    ``out_dir/<source hash>/`` and reused while the source bytes are the same;
+    building a new set removes the earlier sets of the same source.
+    """
+    from PIL import Image, ImageOps, features
+
+    with open(source, "rb") as f:
+        data = f.read()
+    variant_dir = photo_variant_dir(data, out_dir)
+    manifest_path = os.path.join(variant_dir, "variants.json")
+    if not os.path.exists(manifest_path):
+        image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+        side = min(image.size)
+        left, top = (image.width - side) // 2, (image.height - side) // 2
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        square = image.crop((left, top, left + side, top + side)).convert("RGBA" if has_alpha else "RGB")
+        stem = os.path.splitext(os.path.basename(source))[0]
+        os.makedirs(variant_dir, exist_ok=True)
+        with open(os.path.join(variant_dir, "source"), "w") as f:
+            f.write(AssetManifest.key(os.path.abspath(source)))
+        manifest = {}
+        for fmt in PHOTO_FORMATS:
+            if fmt != "png" and not features.check(fmt):
+                continue
+            manifest[fmt] = {}
+            for width in photo_variant_widths(side):
+                variant = square.resize((width, width), Image.LANCZOS)
+                variant.info = {}  # resize copies metadata from the source
+                name = f"{stem}-{width}.{fmt}"
+                tmp = os.path.join(variant_dir, f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                variant.save(tmp, fmt.upper(), **PHOTO_ENCODER_OPTIONS[fmt])
+                os.replace(tmp, os.path.join(variant_dir, name))
+                manifest[fmt][width] = name
+        # Written last: its presence marks a complete set.
+        tmp = f"{manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, manifest_path)
+        prune_photo_variants(source, out_dir, keep=variant_dir)
+
+    return load_photo_variants(variant_dir)
+
+
+def photo_variant_dir(data: bytes, out_dir: str = PHOTO_BUILD_DIR) -> str:
+    return os.path.join(out_dir, f"{hashlib.sha256(data).hexdigest()[:16]}-v{PHOTO_VARIANT_LAYOUT}")
+
+
+def load_photo_variants(variant_dir: str) -> dict:
+    """{format: {width: path}} of a complete variant set; raises OSError if there is none."""
+    with open(os.path.join(variant_dir, "variants.json")) as f:
+        manifest = json.load(f)
+    return {
+        fmt: {int(width): os.path.join(variant_dir, name) for width, name in widths.items()}
+        for fmt, widths in manifest.items()
+    }
+
+
+class PhotoVariantBuilder:
+    """Builds photo variants off the script thread, one set per photo version.
+
+    Like CvPdfBuilder, ``get`` never waits for the encoders: it returns the
+    variants when a set is already on disk (one read and hash of the
+    source), else starts a background build and returns None, so the first
+    page after a photo change shows the source photo. A failed build is not
+    retried until the photo changes.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._variants = OrderedDict()  # (path, mtime_ns) -> {format: {width: path}}
+        self._building = {}  # (path, mtime_ns) -> Thread
+        self.errors = {}  # (path, mtime_ns) -> message of the failed build
+        self.builds = 0
+        self.last_build_ms = None
+
+    def get(self, path: str, mtime_ns: int):
+        """Variants of the photo at ``path``, or None while they are being built."""
+        key = (path, mtime_ns)
+        with self._lock:
+            if key in self._variants:
+                self._variants.move_to_end(key)
+                return self._variants[key]
+            building = key in self._building or key in self.errors
+        if not building:
+            try:
+                with open(path, "rb") as f:
+                    variants = load_photo_variants(photo_variant_dir(f.read()))
+            except (OSError, ValueError):
+                pass
+            else:
+                with self._lock:
+                    self._remember(key, variants)
+                return variants
+        with self._lock:
+            if key not in self._building and key not in self.errors:
+                thread = threading.Thread(
+                    target=self._build_in_background, args=key, name="photo-variants", daemon=True
+                )
+                self._building[key] = thread
+                thread.start()
+        return None
+
+    def build(self, path: str, mtime_ns: int) -> dict:
+        """Build (or load) the variants now and return them."""
+        start = time.perf_counter()
+        variants = build_photo_variants(path)
+        with self._lock:
+            self._remember((path, mtime_ns), variants)
+            self.builds += 1
+            self.last_build_ms = (time.perf_counter() - start) * 1000
+        return variants
+
+    def _remember(self, key: tuple, variants: dict):
+        """Keep ``variants`` for ``key``; called with the lock held."""
+        self._variants[key] = variants
+        self._variants.move_to_end(key)
+        while len(self._variants) > self.max_entries:
+            self._variants.popitem(last=False)
+
+    def _build_in_background(self, path: str, mtime_ns: int):
+        try:
+            self.build(path, mtime_ns)
+        except (ImportError, OSError) as e:
+            print(f"Error building photo variants: {e}")
+            with self._lock:
+                self.errors[(path, mtime_ns)] = str(e)
+        finally:
+            with self._lock:
+                self._building.pop((path, mtime_ns), None)
+
+
+@st.cache_resource
+def get_photo_builder() -> PhotoVariantBuilder:
+    """One photo variant builder per process, shared across sessions and reruns."""
+    return PhotoVariantBuilder()
+
+
+def prune_photo_variants(source: str, out_dir: str, keep: str):
+    """Remove ``source``'s variant sets other than ``keep``, and sets of older layouts."""
+    key = AssetManifest.key(os.path.abspath(source))
+    for name in os.listdir(out_dir):
+        variant_dir = os.path.join(out_dir, name)
+        if variant_dir == keep or not os.path.isdir(variant_dir):
+            continue
+        if name.endswith(f"-v{PHOTO_VARIANT_LAYOUT}"):
+            try:
+                with open(os.path.join(variant_dir, "source")) as f:
+                    if f.read() != key:
+                        continue
+            except OSError:
+                continue  # still being built
+        shutil.rmtree(variant_dir, ignore_errors=True)
+
+
+@st.cache_resource(max_entries=64)
+def get_photo_urls(path: str, mtime_ns: int, _variants: dict):
+    """Published URLs of the photo's built variants (per version).
+
+    Cached so a rerun costs one stat instead of a lookup per variant. Raises
+    OSError if any variant can't be published, so a transient failure is
+    retried on the next run rather than cached.
+    """
+    urls = {fmt: {width: get_static_url(p) for width, p in widths.items()} for fmt, widths in _variants.items()}
+    if not all(url for widths in urls.values() for url in widths.values()):
+        raise OSError("photo variants could not be published")
+    return urls
+
+
+def get_photo(image_filename: str):
+    """The profile photo for render_profile.
+
+    Variant URLs when the variants are built and statically served; else
+    the largest WebP variant as a data URI; else (also while the variants
+    are still being built) the source via get_image_src.
+    """
+    path = find_app_file(image_filename)
+    if path is None:
+        return None
+    mtime_ns = os.stat(path).st_mtime_ns
+    variants = get_photo_builder().get(path, mtime_ns)
+    if not variants:
+        return get_image_src(image_filename)
+    if PHOTO_DELIVERY == "static" and static_serving_enabled():
+        try:
+            return get_photo_urls(path, mtime_ns, variants)
+        except OSError as e:
+            print(f"Error publishing photo variants: {e}")
+    if "webp" in variants:
+        return get_image_src(variants["webp"][max(variants["webp"])], "image/webp")
+    return get_image_src(variants["png"][max(variants["png"])])
+
+
+# ---------------------------
+# STATIC EXPORT
+# ---------------------------
+def render_static_page(content: dict, asset_urls: dict, locale: str = DEFAULT_LOCALE, title: str = PAGE_TITLE) -> str:
+    """The whole portfolio as one HTML document, laid out like the app.
+
+    Tabs switch with CSS radio inputs and the theme with THEME_TOGGLE_HTML,
+    so the page needs no server.
+    """
+    labels = content["labels"]
+    blocks = {section: render(content) for section, render in SECTION_RENDERERS.items()}
+    markup_css = ""
+    if HTML_OPTIMIZE:
+        optimizer = MarkupOptimizer(content)
+        blocks = {section: optimizer.optimize(section, value) for section, value in blocks.items()}
+        markup_css = optimizer.stylesheet()
+    featured_count = len(content["featured_projects"])
+
+    def columns(kind, *cells):
+        return f'<div class="export-columns {kind}">{"".join(f"<div>{cell}</div>" for cell in cells)}</div>'
+
+    photo = asset_urls.get("photo")
+    contact_html, languages_html, study_html = blocks["sidebar"]
+    cv_link = render_cv_link(content, asset_urls["cv"]) if asset_urls.get("cv") else ""
+    sidebar = f"""
+<h3>{escape(labels['theme'])}</h3>
+{THEME_TOGGLE_HTML}
+{render_profile(content, photo)}
+<hr>
+<h3>{escape(labels['contact'])}</h3>
+{contact_html}
+<hr>
+<h3>{escape(labels['languages'])}</h3>
+{languages_html}
+<hr>
+<h3>{escape(labels['current_study'])}</h3>
+{study_html}
+<hr>
+{cv_link}
+"""
+
+    projects = [f"<h2>{escape(labels['featured_projects'])}</h2>"]
+    for card, side in blocks["projects"][:featured_count]:
+        projects.append(columns("cols-2-1", card, side) + "<br>")
+    projects.append(f"<h2>{escape(labels['web_projects'])}</h2>")
+    projects.append(columns("cols-2", *blocks["projects"][featured_count:]))
+    about_html, focus_html, interests_html = blocks["about"]
+    panels = [
+        "".join(projects),
+        f"<h2>{escape(labels['experience'])}</h2>" + "".join(blocks["experience"]),
+        columns(
+            "cols-2",
+            f"<h2>{escape(labels['education'])}</h2>" + "".join(blocks["education"]),
+            f"<h2>{escape(labels['skills'])}</h2>" + "".join(blocks["skills"]),
+        ),
+        f"<h2>{escape(labels['about'])}</h2>{about_html}"
+        f"<h2>{escape(labels['goals'])}</h2>" + columns("cols-2", focus_html, interests_html),
+    ]
+    radios = "".join(
+        f'<input type="radio" name="export-tab" id="tab-{i}"{" checked" if i == 0 else ""}>'
+        for i in range(len(panels))
+    )
+    tab_list = "".join(
+        f'<label for="tab-{i}" data-baseweb="tab">{escape(label)}</label>'
+        for i, label in enumerate(labels["tabs"])
+    )
+    tab_panels = "".join(
+        f'<div class="export-panel panel-{i}">{panel}</div>' for i, panel in enumerate(panels)
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="{locale}" data-theme="light">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(title)}</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>{PAGE_ICON}</text></svg>">
+{font_preload_links(asset_urls.get("fonts", {}))}
+{markup_css}
+<link rel="stylesheet" href="{escape(asset_urls['css'])}">
+</head>
+<body>
+<div class="stApp export-layout">
+<aside data-testid="stSidebar">{sidebar}</aside>
+<main class="block-container">
+{blocks['hero'][0]}
+<h2>{escape(labels['impact'])}</h2>
+{columns("cols-4", *blocks['stats'])}
+<br><br>
+<div class="stTabs export-tabs">
+{radios}
+<div data-baseweb="tab-list">{tab_list}</div>
+{tab_panels}
+</div>
+<br>
+{blocks['footer'][0]}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def export_site(out_dir: str, locale: str = DEFAULT_LOCALE, profile: str = "") -> list:
+    """Write the static site to ``out_dir`` and return the written paths.
+
+    Assets get content-hashed names and nothing time-dependent is written,
+    so the same content always produces byte-identical output.
+    """
+    content, content_version = load_content(locale, profile)
+    files = {}  # relative path -> bytes
+    asset_urls = {}
+
+    # Font URLs in the stylesheet are relative to assets/, where it lives.
+    font_names = {}
+    for weight, name in font_files().items():
+        data = get_file_bytes(os.path.join(FONTS_DIR, name))
+        if data:
+            font_names[weight] = hashed_name(name, data)
+            files[f"assets/{font_names[weight]}"] = data
+    asset_urls["fonts"] = {weight: f"assets/{name}" for weight, name in font_names.items()}
+    font_css = font_face_css(font_names) if font_names else GOOGLE_FONTS_IMPORT
+
+    css = (font_css + build_css("export")).encode("utf-8")
+    asset_urls["css"] = f"assets/{hashed_name('portfolio.css', css)}"
+    files[asset_urls["css"]] = css
+    cv_content, cv_version = (content, content_version) if locale in CV_PDF_LOCALES else load_content(profile=profile)
+    sources = {"photo": content["profile"]["photo"], "cv": get_cv_file(cv_content, cv_version, wait=True)}
+    photo_path = find_app_file(sources["photo"])
+    variants = None
+    if photo_path:
+        try:
+            variants = get_photo_builder().build(photo_path, os.stat(photo_path).st_mtime_ns)
+        except (ImportError, OSError) as e:
+            print(f"Error building photo variants: {e}")
+    if variants:
+        # The variants replace the full-size photo.
+        del sources["photo"]
+        asset_urls["photo"] = {fmt: {} for fmt in variants}
+        for fmt, widths in variants.items():
+            for width, path in widths.items():
+                data = get_file_bytes(path)
+                asset_urls["photo"][fmt][width] = f"assets/{hashed_name(path, data)}"
+                files[asset_urls["photo"][fmt][width]] = data
+    for key, source in sources.items():
+        data = get_file_bytes(source)
+        if data:
+            asset_urls[key] = f"assets/{hashed_name(content['profile'][key], data)}"
+            files[asset_urls[key]] = data
+
+    title = f"{content['profile']['name']} | Portfolio" if profile else PAGE_TITLE
+    files["index.html"] = render_static_page(content, asset_urls, locale, title).encode("utf-8")
+
+    written = []
+    for rel_path in sorted(files):
+        path = os.path.join(out_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(files[rel_path])
+        written.append(path)
+    return written
+
+
+# ---------------------------
+# FONT BUILD
+# ---------------------------
+# Characters always kept in the subset, on top of those the content uses, so
+# small content edits render without a rebuild.
+FONT_BASE_CHARS = (
+    "".join(chr(c) for c in range(0x20, 0x7F))
+    + "".join(chr(c) for c in range(0xA0, 0x100))
+    + "–—‘’“”•·…→←↑↓✓×€"
+)
+
+
+def used_font_weights(content: dict) -> list:
+    """Font weights the stylesheet and rendered content ask for."""
+    page = build_css("export") + render_static_page(content, {"css": ""})
+    weights = {400, 600, 700}  # body text and Streamlit's headings/bold
+    for value in re.findall(r"font-weight\s*:\s*(\w+)", page):
+        weight = {"normal": 400, "bold": 700}.get(value, value)
+        if str(weight).isdigit() and int(weight) in POPPINS_SOURCES:
+            weights.add(int(weight))
+    return sorted(weights)
+
+
+def font_subset_text(content: dict) -> str:
+    """Every character the rendered page can show, for font subsetting."""
+    page = render_static_page(content, {"css": ""})
+    page = re.sub(r"<(script|style)\b.*?</\1>", "", page, flags=re.S)
+    text = unescape(re.sub(r"<[^>]+>", "", page))
+    return "".join(sorted(set(text + FONT_BASE_CHARS) - set("\n\r\t")))
+
+
+def build_fonts(source_dir: str, out_dir: str = FONTS_DIR) -> list:
+    """Subset the Poppins TTFs in ``source_dir`` to WOFF2 faces in ``out_dir``.
+
+    Only the weights the page uses are built, limited to the characters it
+    can show. Needs fontTools with brotli (``pip install fonttools brotli``).
+    """
+    from fontTools import subset
+
+    content, _ = load_content()
+    text = "".join(sorted(set("".join(font_subset_text(load_content(locale)[0]) for locale in LOCALES))))
+    options = subset.Options()
+    options.flavor = "woff2"
+    # fontTools' default layout features include the Devanagari shaping
+    # (akhn, half, pres, abvs, blws, rphf...) and mark positioning the
+    # Hindi locale needs; narrowing them breaks conjuncts and vowel signs.
+    options.hinting = False
+    options.desubroutinize = True
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name in os.listdir(out_dir):
+        if re.fullmatch(r"poppins-\d{3}\.woff2", name):
+            os.remove(os.path.join(out_dir, name))
+
+    written = []
+    for weight in used_font_weights(content):
+        source = os.path.join(source_dir, POPPINS_SOURCES[weight])
+        if not os.path.exists(source):
+            print(f"Skipping weight {weight}: {source} not found", file=sys.stderr)
+            continue
+        font = subset.load_font(source, options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        path = os.path.join(out_dir, f"poppins-{weight}.woff2")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        subset.save_font(font, tmp, options)
+        os.replace(tmp, path)
+        written.append(path)
+    return written
+
+
+# ---------------------------
+# COMMAND LINE
+# ---------------------------
+def main(argv=None) -> int:
+    """Build tasks; the site itself runs with ``streamlit run My_Cv.py``."""
+    parser = argparse.ArgumentParser(
+        prog="My_Cv.py",
+        description="Portfolio build tasks. Serve the app with: streamlit run My_Cv.py",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="render the portfolio to a static HTML bundle")
+    export.add_argument("--out", default="dist", help="output directory (default: dist)")
+    export.add_argument("--locale", default=DEFAULT_LOCALE, choices=sorted(LOCALES), help="page language")
+    export.add_argument("--profile", default="", help="profile under PROFILES_DIR (default: the app's own content)")
+    fonts = commands.add_parser("fonts", help="build subsetted WOFF2 Poppins faces into static/fonts")
+    fonts.add_argument("--source", required=True, help="directory with the Poppins-*.ttf files")
+    cv = commands.add_parser("cv", help="generate the CV PDF from the content file")
+    cv.add_argument("--out", default=None, help="also copy the PDF here, e.g. Raja_Roy_CV.pdf")
+    images = commands.add_parser("images", help="build the profile photo's resized variants")
+    images.add_argument("--profile", default="", help="profile under PROFILES_DIR (default: the app's own content)")
+    stats = commands.add_parser("analytics", help="print the aggregated visitor analytics")
+    stats.add_argument("--days", type=int, default=30, help="period to aggregate (default: 30)")
+    outbox = commands.add_parser("contact", help="deliver due contact messages and show the queue")
+    outbox.add_argument("--now", action="store_true", help="also try messages still waiting out a retry delay")
+    outbox.add_argument("--retry-failed", action="store_true", help="queue failed messages for another round")
+    health = commands.add_parser("health", help="check the featured projects' demo links")
+    health.add_argument("urls", nargs="*", help="URLs to check instead of the content's demo links")
+    args = parser.parse_args(argv)
+    # Caches work without a Streamlit runtime; don't warn about it.
+    st.logger.set_log_level("error")
+
+    if args.command == "export":
+        if not profile_exists(args.profile):
+            print(f"Unknown profile '{args.profile}'", file=sys.stderr)
+            return 1
+        for path in export_site(args.out, args.locale, args.profile):
+            print(path)
+    elif args.command == "fonts":
+        try:
+            paths = build_fonts(args.source)
+        except ImportError:
+            print("Building fonts needs fontTools: pip install fonttools brotli", file=sys.stderr)
+            return 1
+        for path in paths:
+            print(f"{path} ({os.path.getsize(path)} bytes)")
+    elif args.command == "cv":
+        content, content_version = load_content()
+        builder = get_cv_builder()
+        try:
+            path = builder.build(content, cv_build_key(content_version))
+        except ImportError:
+            print("Generating the CV needs fpdf2: pip install fpdf2", file=sys.stderr)
+            return 1
+        if args.out:
+            with open(path, "rb") as src, open(args.out, "wb") as dst:
+                dst.write(src.read())
+            path = args.out
+        built = f" built in {builder.last_build_ms:.0f} ms" if builder.builds else " (cached)"
+        print(f"{path} ({os.path.getsize(path)} bytes){built}")
+    elif args.command == "images":
+        if not profile_exists(args.profile):
+            print(f"Unknown profile '{args.profile}'", file=sys.stderr)
+            return 1
+        try:
+            variants = build_photo_variants(load_content(profile=args.profile)[0]["profile"]["photo"])
+        except ImportError:
+            print("Building image variants needs Pillow: pip install pillow", file=sys.stderr)
+            return 1
+        for fmt, widths in variants.items():
+            for width, path in sorted(widths.items()):
+                print(f"{path} ({os.path.getsize(path)} bytes)")
+    elif args.command == "analytics":
+        print(json.dumps(analytics.get_writer().summary(args.days), indent=2, ensure_ascii=False))
+    elif args.command == "contact":
+        try:
+            queue = contact.ContactQueue(contact.CONTACT_QUEUE_DB, contact.contact_backend(contact.CONTACT_BACKEND))
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        if args.retry_failed:
+            queue.requeue_failed()
+        delivered = queue.deliver_due(float("inf") if args.now else None)
+        print(f"delivered {delivered} via {contact.CONTACT_BACKEND}; queue: {json.dumps(queue.stats())}")
+    elif args.command == "health":
+        urls = args.urls or [project["demo_url"] for project in load_content()[0]["featured_projects"]]
+        checker = demo_health.DemoHealthChecker()
+        for url, result in asyncio.run(checker.check_all(urls)).items():
+            print(f"{result['status']:<9} {result['latency_ms']:>6} ms  {url}  ({result['detail']})")
+    return 0
+
+
+if __name__ == "__main__" and not runtime.exists():
+    sys.exit(main())
+
+# ---------------------------
+# PAGE CONFIG
+# ---------------------------
+run_started = time.perf_counter()
+st.set_page_config(
+    page_title=PAGE_TITLE,
+    page_icon=PAGE_ICON,
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+st.session_state.payload_debug = payload_debug_enabled()
+st.session_state.payload_log = []
+
+# ---------------------------
+# PROFILE + CONTENT + THEME STATE
+# ---------------------------
+profile = st.query_params.get("profile", "")
+if not profile_exists(profile):
+    st.error(f"Unknown profile '{profile}'.")
+    st.stop()
+
+if "locale" not in st.session_state:
+    requested = st.query_params.get("lang", DEFAULT_LOCALE)
+    st.session_state.locale = requested if requested in LOCALES else DEFAULT_LOCALE
+locale = st.session_state.locale
+if st.query_params.get("lang", DEFAULT_LOCALE) != locale:
+    st.query_params["lang"] = locale
+
+content, content_version = load_content(locale, profile)
+labels = content["labels"]
+get_profile_registry().visit(profile, content_version)
+if not st.session_state.get("page_view_tracked"):
+    track("page_view", profile, locale)
+    st.session_state.page_view_tracked = True
+if profile:
+    st.set_page_config(page_title=f"{content['profile']['name']} | Portfolio")
+
+# Tab state holds the tab's label; keep the same tab open across a switch.
+previous_locale = st.session_state.get("rendered_locale", locale)
+if previous_locale != locale and st.session_state.get("active_tab"):
+    previous_tabs = load_content(previous_locale, profile)[0]["labels"]["tabs"]
+    if st.session_state.active_tab in previous_tabs:
+        st.session_state.active_tab = labels["tabs"][previous_tabs.index(st.session_state.active_tab)]
+st.session_state.rendered_locale = locale
+
+if THEME_MODE == "server" and "theme" not in st.session_state:
+    st.session_state.theme = "light"
+
+# ---------------------------
+# SIDEBAR THEME TOGGLE (top) + CSS (Light/Dark + Narrow Sidebar + Mobile Fixes)
+# ---------------------------
+@st.fragment
+def theme_fragment():
+    """Theme picker plus the stylesheet it selects.
+
+    As a fragment, a server-mode theme change reruns only this function; the
+    <style> element it emits restyles the whole page.
+    """
+    emit("theme", f"### {labels['theme']}", html=False)
+    if THEME_MODE == "server":
+        theme_choice = st.radio(
+            "Theme",
+            ["Light", "Dark"],
+            index=0 if st.session_state.theme == "light" else 1,
+            key="theme_choice",
+            label_visibility="collapsed"
+        )
+        st.session_state.theme = "light" if theme_choice == "Light" else "dark"
+    else:
+        st.html(THEME_TOGGLE_HTML, unsafe_allow_javascript=True)
+
+    # Name of the stylesheet bundle; "client" carries both palettes.
+    bundle = st.session_state.theme if THEME_MODE == "server" else "client"
+    emit("css", get_markup_stylesheet(content, content_version) + get_stylesheet(bundle))
+
+
+with st.sidebar:
+    theme_fragment()
+    # A language switch reruns the page; each locale's sections come from
+    # the fragment cache under its own content version.
+    emit("language", f"### {labels['page_language']}", html=False)
+    st.radio(
+        "Language",
+        list(LOCALES),
+        format_func=LOCALES.get,
+        key="locale",
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+
+theme = st.session_state.theme if THEME_MODE == "server" else "client"
+
+# ---------------------------
+# SIDEBAR CONTENT
+# ---------------------------
+@st.fragment
+def cv_download_fragment():
+    """CV download; neither mode sends the PDF bytes with the page."""
+    cv_content, cv_version = (content, content_version) if locale in CV_PDF_LOCALES else load_content(profile=profile)
+    cv_filename = get_cv_file(cv_content, cv_version)
+    cv_url = get_static_url(cv_filename) if CV_DELIVERY == "static" else None
+
+    if cv_url:
+        emit("sidebar", render_cv_link(content, cv_url))
+    elif find_app_file(cv_filename):
+        session = session_key()
+
+        def cv_bytes():
+            # Called on click: the bytes go through the media manager only then.
+            track("cv_downloaded", profile, "deferred", session)
+            return get_file_bytes(cv_filename)
+
+        st.download_button(
+            label=labels["download_cv"],
+            data=cv_bytes,
+            file_name=os.path.basename(cv_filename),
+            mime="application/pdf",
+            on_click="ignore",
+            width="stretch"
+        )
+    else:
+        st.warning(f"⚠️ CV not found. Add '{os.path.basename(content['profile']['cv'])}' to your app folder.")
+
+
+@st.fragment
+def contact_form_fragment():
+    """Contact form; sending only queues the message (see ContactQueue)."""
+    form_labels = labels["contact_form"]
+    queue = contact.get_queue()
+    # A mistyped CONTACT_BACKEND leaves the form disabled rather than broken.
+    popover = st.popover(form_labels["open"], width="stretch", key="contact_popover", on_change="rerun",
+                         disabled=queue is None)
+    # Like the lazy tabs: built once first opened, then kept so a draft survives closing.
+    if popover.open:
+        st.session_state.contact_form_opened = True
+    if queue is None or not st.session_state.get("contact_form_opened"):
+        return
+    with popover:
+        with st.form("contact_form", border=False):
+            name = st.text_input(form_labels["name"], max_chars=100).strip()
+            email = st.text_input(form_labels["email"], max_chars=254).strip()
+            message = st.text_area(form_labels["message"], max_chars=5000).strip()
+            submitted = st.form_submit_button(form_labels["send"], width="stretch")
+        if submitted:
+            if not contact.valid_contact(name, email, message):
+                st.error(form_labels["invalid"])
+            elif time.time() - st.session_state.get("contact_sent_at", 0) < CONTACT_MIN_INTERVAL:
+                st.warning(form_labels["too_soon"])
+            else:
+                recipient = CONTACT_TO or content["footer"]["email"]
+                queue.submit(profile, recipient, name, email, message)
+                st.session_state.contact_sent_at = time.time()
+                st.success(form_labels["sent"])
+
+
+# Started on the first page run, so messages left pending by an earlier
+# process are delivered without waiting for a new submission.
+contact.get_queue()
+
+with st.sidebar:
+    photo = get_photo(content["profile"]["photo"])
+    emit("sidebar", render_profile(content, photo))
+    if not photo:
+        st.info(f"📸 Add '{os.path.basename(content['profile']['photo'])}' for your profile picture")
+
+    emit("sidebar", "---", html=False)
+
+    contact_html, languages_html, study_html = get_section("sidebar", content, content_version, theme)
+
+    emit("sidebar", f"### {labels['contact']}", html=False)
+    emit("sidebar", contact_html)
+    contact_form_fragment()
+
+    emit("sidebar", "---", html=False)
+
+    emit("sidebar", f"### {labels['languages']}", html=False)
+    emit("sidebar", languages_html)
+
+    emit("sidebar", "---", html=False)
+
+    emit("sidebar", f"### {labels['current_study']}", html=False)
+    emit("sidebar", study_html)
+
+    emit("sidebar", "---", html=False)
+
+    cv_download_fragment()
+
+
+# ---------------------------
+# HERO SECTION
+# ---------------------------
+hero_html, = get_section("hero", content, content_version, theme)
+emit("hero", hero_html)
+
+# ---------------------------
+# STATS
+# ---------------------------
+emit("stats", f"## {labels['impact']}", html=False)
+stat_blocks = get_section("stats", content, content_version, theme)
+for col, stat_html in zip(st.columns(len(stat_blocks)), stat_blocks):
+    with col:
+        emit("stats", stat_html)
+
+emit("stats", "<br><br>")
+
+# ---------------------------
+# TAG FILTERS
+# ---------------------------
+tag_index = compile_tag_index(content_version, content)
+with st.popover(labels["filters"]["title"]):
+    facet_selection = {
+        facet: st.multiselect(labels["filters"][facet], tag_index.options(facet), key=f"filter_{facet}")
+        for facet in FACETS
+    }
+card_mask = tag_index.match(facet_selection)
+if card_mask != tag_index.all:
+    st.caption(labels["filters"]["showing"].format(shown=card_mask.bit_count(), total=len(tag_index.bits)))
+
+# ---------------------------
+# TABS
+# ---------------------------
+@st.fragment(run_every=2)
+def demo_health_poller(urls):
+    """Reruns the page once the first demo health results are in."""
+    if all(result is not None for result in get_demo_health_checker().get(urls).values()):
+        st.rerun()
+
+
+@st.fragment
+def fraud_demo_fragment():
+    """Fraud model demo; scoring and toggling rerun only this fragment."""
+    if not st.toggle(labels["try_demo"], key="fraud_demo_open"):
+        return
+    try:
+        with st.spinner("Loading the model..."):
+            fraud_model = get_fraud_model()
+    except ImportError as e:
+        st.warning(f"The demo needs pandas and scikit-learn ({e.name} is not installed).")
+        return
+
+    auc = f" · ROC AUC {fraud_model['auc']:.3f} on held-out data" if fraud_model["auc"] is not None else ""
+    st.caption(f"Model: {fraud_model['source']}{auc}")
+    st.caption("Columns: " + ", ".join(FRAUD_FEATURES))
+    st.download_button(
+        f"Sample CSV ({FRAUD_SAMPLE_ROWS:,} transactions)",
+        data=fraud_sample_csv,
+        file_name="transactions_sample.csv",
+        mime="text/csv",
+        on_click="ignore",
+    )
+    upload = st.file_uploader("Transactions CSV", type="csv", key="fraud_demo_csv")
+    if upload is None:
+        return
+
+    # Score each upload once per session, not on every fragment rerun.
+    result = st.session_state.get("fraud_demo_result")
+    if not result or result["file_id"] != upload.file_id:
+        progress = st.progress(0.0, text="Scoring...")
+        try:
+            summary = score_transactions(
+                fraud_model["model"], upload, upload.size,
+                lambda rows, done: progress.progress(done, text=f"Scored {rows:,} rows..."),
+            )
+        except ValueError as e:
+            progress.empty()
+            st.error(str(e))
+            return
+        progress.empty()
+        # Only the summary is kept, not the scored upload.
+        result = {"file_id": upload.file_id, **summary}
+        st.session_state.fraud_demo_result = result
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rows scored", f"{result['rows']:,}")
+    col2.metric("Flagged", f"{result['flagged']:,}")
+    col3.metric("Rows / second", f"{result['rate']:,.0f}")
+    st.dataframe(
+        result["top"],
+        width="stretch",
+        column_config={"fraud_probability": st.column_config.ProgressColumn("Fraud probability", min_value=0.0, max_value=1.0)},
+    )
+
+
+def projects_tab():
+    project_blocks = get_section("projects", content, content_version, theme)
+    featured_count = len(content["featured_projects"])
+    featured = [
+        (project, card, side)
+        for position, (project, (card, side)) in enumerate(zip(content["featured_projects"], project_blocks[:featured_count]))
+        if tag_index.shows(card_mask, "featured", position)
+    ]
+    web = [
+        project_html
+        for position, project_html in enumerate(project_blocks[featured_count:])
+        if tag_index.shows(card_mask, "web", position)
+    ]
+    if not featured and not web:
+        st.info(labels["filters"]["no_matches"])
+        return
+
+    if featured:
+        emit("projects", f"## {labels['featured_projects']}", html=False)
+
+    health = {}
+    if DEMO_HEALTH and featured:
+        demo_urls = [project["demo_url"] for project in content["featured_projects"]]
+        health = get_demo_health_checker().get(demo_urls)
+        if any(result is None for result in health.values()):
+            demo_health_poller(demo_urls)
+
+    for project, card, side in featured:
+        colA, colB = st.columns([2, 1])
+        with colA:
+            emit("projects", card)
+            if DEMO_HEALTH:
+                emit("projects", render_demo_status(health[project["demo_url"]], labels))
+        with colB:
+            emit("projects", side)
+        if project.get("live_demo") == "fraud":
+            fraud_demo_fragment()
+        emit("projects", "<br>")
+
+    if web:
+        emit("projects", f"## {labels['web_projects']}", html=False)
+
+        cols = st.columns(2)
+        for i, project_html in enumerate(web):
+            with cols[i % 2]:
+                emit("projects", project_html)
+
+
+def experience_tab():
+    emit("experience", f"## {labels['experience']}", html=False)
+
+    shown = 0
+    for position, exp_html in enumerate(get_section("experience", content, content_version, theme)):
+        if tag_index.shows(card_mask, "experience", position):
+            emit("experience", exp_html)
+            shown += 1
+    if not shown:
+        st.info(labels["filters"]["no_matches"])
+
+
+def education_tab():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        emit("education", f"## {labels['education']}", html=False)
+
+        for edu_html in get_section("education", content, content_version, theme):
+            emit("education", edu_html)
+
+    with col2:
+        emit("skills", f"## {labels['skills']}", html=False)
+
+        for group_html in get_section("skills", content, content_version, theme):
+            emit("skills", group_html)
+
+
+def about_tab():
+    about_html, focus_html, interests_html = get_section("about", content, content_version, theme)
+
+    emit("about", f"## {labels['about']}", html=False)
+
+    emit("about", about_html)
+
+    emit("about", f"## {labels['goals']}", html=False)
+
+    colA, colB = st.columns(2)
+
+    with colA:
+        emit("about", focus_html)
+
+    with colB:
+        emit("about", interests_html)
+
+
+def should_render_tab(index: int, tab) -> bool:
+    """Lazy tabs render once first selected, then stay rendered for the session."""
+    if tab.open is None:
+        return True
+    visited = st.session_state.setdefault("visited_tabs", set())
+    if tab.open:
+        visited.add(index)
+    return index in visited
+
+
+if LAZY_TABS:
+    tabs = st.tabs(labels["tabs"], key="active_tab", on_change="rerun")
+    # Tracked by index so the same tab counts once in every language.
+    if st.session_state.active_tab in labels["tabs"]:
+        tab_index = labels["tabs"].index(st.session_state.active_tab)
+        if tab_index != st.session_state.get("tracked_tab", 0):
+            track("tab_selected", profile, str(tab_index))
+            st.session_state.tracked_tab = tab_index
+else:
+    tabs = st.tabs(labels["tabs"])
+
+for index, (tab, render_tab) in enumerate(zip(tabs, (projects_tab, experience_tab, education_tab, about_tab))):
+    with tab:
+        if should_render_tab(index, tab):
+            render_tab()
+
+# ---------------------------
+# FOOTER
+# ---------------------------
+emit("footer", "<br>")
+footer_html, = get_section("footer", content, content_version, theme)
+emit("footer", footer_html)
+
+if st.session_state.payload_debug:
+    payload_debug_panel()
+
+if analytics_dashboard_enabled():
+    analytics_dashboard(profile, load_content(profile=profile)[0]["labels"]["tabs"])
+
+profile_registry = get_profile_registry()
+profile_registry.record_render(profile, (time.perf_counter() - run_started) * 1000)
+profile_registry.enforce_budget(profile)
+# streamlit run My_Cv.py
@@ -0,0 +1,184 @@
+"""Visitor analytics for the portfolio, shared by My_Cv.py and serve.py.
+
+Events (page views, tab selections, CV downloads, demo link clicks) are
+appended to a bounded in-memory queue; a background thread writes them to
+SQLite in batches, so recording one costs a deque append. When the queue
+is full new events are dropped and counted rather than blocking a rerun.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# SQLite file the events are written to (build/ is not committed).
+ANALYTICS_DB = os.path.join(APP_DIR, os.environ.get("ANALYTICS_DB", os.path.join("build", "analytics.sqlite3")))
+EVENT_KINDS = ("page_view", "tab_selected", "cv_downloaded", "demo_clicked")
+# Events held in memory at most; beyond that they are dropped and counted.
+QUEUE_MAX = int(os.environ.get("ANALYTICS_QUEUE_MAX", 10_000))
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 2.0  # seconds between writes while events trickle in
+DETAIL_MAX = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    session TEXT NOT NULL DEFAULT '',
+    profile TEXT NOT NULL DEFAULT '',
+    detail TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS events_kind_ts ON events (kind, ts);
+"""
+
+
+class EventWriter:
+    """Bounded event queue drained into SQLite by one background thread."""
+
+    def __init__(self, db_path: str, max_queue: int = QUEUE_MAX, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()  # guards the writer thread and flushes
+        self._thread = None
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_flush_ms = None
+
+    def record(self, kind: str, session: str = "", profile: str = "", detail: str = "") -> bool:
+        """Queue one event; False if it was dropped because the queue is full."""
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return False
+        self._queue.append((time.time(), kind, session, profile, detail[:DETAIL_MAX]))
+        self.recorded += 1
+        if self._thread is None:
+            self._start()
+        elif len(self._queue) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def flush(self) -> int:
+        """Write every queued event now, in batches; returns the number written."""
+        total = 0
+        with self._lock:
+            if not self._queue:
+                return 0
+            try:
+                connection = self._connect()
+            except (OSError, sqlite3.Error) as e:
+                # Events stay queued (up to max_queue) for the next attempt.
+                print(f"Error opening analytics database: {e}")
+                self.errors += 1
+                return 0
+            try:
+                while self._queue:
+                    batch = []
+                    while self._queue and len(batch) < self.batch_size:
+                        batch.append(self._queue.popleft())
+                    start = time.perf_counter()
+                    try:
+                        with connection:
+                            connection.executemany(
+                                "INSERT INTO events (ts, kind, session, profile, detail) VALUES (?, ?, ?, ?, ?)",
+                                batch,
+                            )
+                    except sqlite3.Error as e:
+                        # The batch is lost; keep the queue moving.
+                        print(f"Error writing analytics events: {e}")
+                        self.errors += 1
+                        continue
+                    self.written += len(batch)
+                    self.batches += 1
+                    self.last_flush_ms = (time.perf_counter() - start) * 1000
+                    total += len(batch)
+            finally:
+                connection.close()
+        return total
+
+    def summary(self, days: int = 30, profile: str = None) -> dict:
+        """Aggregates for the dashboard over the last ``days`` days, of one ``profile`` if given."""
+        since = time.time() - days * 86400
+        scope, scope_params = ("", ()) if profile is None else (" AND profile = ?", (profile,))
+        connection = self._connect()
+        try:
+            def rows(sql, *params):
+                return [list(row) for row in connection.execute(sql.format(scope=scope), (since, *scope_params, *params))]
+
+            return {
+                "totals": dict(rows("SELECT kind, COUNT(*) FROM events WHERE ts >= ?{scope} GROUP BY kind")),
+                "sessions": rows("SELECT COUNT(DISTINCT session) FROM events WHERE ts >= ?{scope} AND session != ''")[0][0],
+                "daily": rows(
+                    "SELECT date(ts, 'unixepoch') AS day, kind, COUNT(*) FROM events WHERE ts >= ?{scope} "
+                    "GROUP BY day, kind ORDER BY day"
+                ),
+                "top": {
+                    kind: rows(
+                        "SELECT detail, COUNT(*) AS n FROM events WHERE ts >= ?{scope} AND kind = ? "
+                        "GROUP BY detail ORDER BY n DESC LIMIT 10",
+                        kind,
+                    )
+                    for kind in ("tab_selected", "demo_clicked", "cv_downloaded")
+                },
+                "profiles": rows(
+                    "SELECT profile, COUNT(*) AS n FROM events WHERE ts >= ?{scope} AND kind = 'page_view' "
+                    "GROUP BY profile ORDER BY n DESC"
+                ),
+            }
+        finally:
+            connection.close()
+
+    def stats(self) -> dict:
+        """Snapshot of the queue counters."""
+        return {
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "errors": self.errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(db_path: str = ANALYTICS_DB) -> EventWriter:
+    """The process-wide writer for ``db_path``, shared by the app and serve.py."""
+    with _writers_lock:
+        if db_path not in _writers:
+            _writers[db_path] = EventWriter(db_path)
+        return _writers[db_path]
@@ -0,0 +1,171 @@
+"""Rerun benchmarks for My_Cv.py, driven headlessly with Streamlit's AppTest.
+
+Scenarios:
+    cold_start    first run of a fresh session with empty process caches
+    warm_rerun    plain rerun of an already rendered session
+    theme_toggle  flip the sidebar theme radio (THEME_MODE=server)
+    tab_switch    select the next tab (lazy tabs)
+
+For each scenario the median wall time, peak Python memory (tracemalloc),
+element count and total serialized element bytes are recorded.
+
+    python benchmarks/bench_reruns.py                      # write results JSON
+    python benchmarks/bench_reruns.py --baseline old.json  # also compare
+
+The run exits with status 1 when a metric is worse than the baseline by
+more than --threshold (a fraction, default 0.20).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "My_Cv.py")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+METRICS = ("wall_ms", "peak_kb", "elements", "bytes")
+
+
+def new_app(**env) -> AppTest:
+    # No live demo probes: the numbers must not depend on the network.
+    os.environ.update({"THEME_MODE": "client", "LAZY_TABS": "1", "DEMO_HEALTH": "0", **env})
+    return AppTest.from_file(APP, default_timeout=60)
+
+
+def measure(at: AppTest, action=None) -> dict:
+    """Apply ``action`` to the app, rerun it and collect metrics."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    if action:
+        action(at)
+    at.run()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception[0].message}")
+
+    elements = 0
+    size = 0
+    stack = [at._tree]
+    while stack:
+        node = stack.pop()
+        children = getattr(node, "children", None)
+        if children is not None:
+            stack.extend(children.values())
+        else:
+            elements += 1
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            size += proto.ByteSize()
+    return {"wall_ms": wall * 1000, "peak_kb": peak / 1024, "elements": elements, "bytes": size}
+
+
+def cold_start():
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    return measure(new_app())
+
+
+def warm_rerun():
+    at = new_app()
+    at.run()
+    return measure(at)
+
+
+def theme_toggle():
+    at = new_app(THEME_MODE="server")
+    at.run()
+    current = at.sidebar.radio[0].value
+    target = "Dark" if current == "Light" else "Light"
+    return measure(at, lambda app: app.sidebar.radio[0].set_value(target))
+
+
+def tab_switch():
+    at = new_app()
+    at.run()
+    labels = [tab.label for tab in at.tabs]
+    return measure(at, lambda app: app.session_state.__setitem__("active_tab", labels[1]))
+
+
+SCENARIOS = {
+    "cold_start": cold_start,
+    "warm_rerun": warm_rerun,
+    "theme_toggle": theme_toggle,
+    "tab_switch": tab_switch,
+}
+
+
+def run_suite(scenarios, repeat: int) -> dict:
+    results = {}
+    for name in scenarios:
+        samples = [SCENARIOS[name]() for _ in range(repeat)]
+        results[name] = {
+            metric: round(statistics.median(sample[metric] for sample in samples), 3)
+            for metric in METRICS
+        }
+        print(f"{name:14s} " + "  ".join(f"{m}={results[name][m]:.1f}" for m in METRICS))
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Metrics that regressed by more than ``threshold`` against ``baseline``."""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if old and value > old * (1 + threshold):
+                regressions.append(f"{name}.{metric}: {old:.1f} -> {value:.1f} (+{(value / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per scenario (median is kept)")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<git rev>.json)")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="allowed regression as a fraction")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    st.logger.set_log_level("error")
+
+    revision = git_revision()
+    results = run_suite(args.scenario or list(SCENARIOS), args.repeat)
+    output = args.output or os.path.join(RESULTS_DIR, f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"revision": revision, "repeat": args.repeat, "results": results}, f, indent=2)
+        f.write("\n")
+    print(f"results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
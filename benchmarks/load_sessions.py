@@ -0,0 +1,293 @@
+"""Concurrent-session load test for My_Cv.py over Streamlit's websocket protocol.
+
+The harness starts the app with ``streamlit run`` on a free local port and,
+for each requested session count N, opens N simulated browser sessions at
+once. Every session renders the page, then follows a script that alternates
+a theme toggle (a fragment rerun, THEME_MODE=server) with a tab switch (a
+full rerun, lazy tabs), exactly as the browser would send them.
+
+Per level it records:
+    p50/p95/p99_ms     rerun latency, from sending the BackMsg until the
+                       session's script_finished message arrives
+    connect_p95_ms     latency of each session's first render
+    reruns_per_s       scripted reruns completed per second, all sessions
+    rss_kb             peak resident memory of the server during the level
+    rss_per_session_kb (peak RSS - idle RSS) / N
+
+The level where p95 first exceeds --knee-factor times the lowest level's p95
+is reported as the knee.
+
+    python benchmarks/load_sessions.py --sessions 1 5 10 25 50
+    python benchmarks/load_sessions.py --baseline benchmarks/results/load-old.json
+
+RSS is read from /proc and is only available on Linux.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench_reruns import APP, RESULTS_DIR, ROOT, compare, git_revision
+
+COMPARED = ("p50_ms", "p95_ms", "p99_ms", "rss_per_session_kb")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, timeout: float = 60) -> subprocess.Popen:
+    """Run the app headless on ``port`` and wait until it reports healthy."""
+    env = {
+        **os.environ,
+        "THEME_MODE": "server",
+        "LAZY_TABS": "1",
+        "DEMO_HEALTH": "0",
+        "STREAMLIT_BROWSER_GATHER_USAGE_STATS": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(port), "--server.fileWatcherType", "none"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit did not become healthy in time")
+
+
+def rss_kb(pid: int):
+    """Resident set size of ``pid`` in KiB, or None off Linux."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Session:
+    """One simulated browser tab: a websocket plus the widget state it holds."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ws = None
+        self.widgets = {}
+        self.theme_id = ""
+        self.theme_fragment = ""
+        self.tab_id = ""
+        self.tab_labels = []
+        self.theme = "Light"
+        self.tab = 0
+
+    async def open(self) -> float:
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return await self.rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, fragment_id: str = "") -> float:
+        """Send a rerun with the current widget state; return its latency in ms."""
+        message = BackMsg()
+        request = message.rerun_script
+        request.query_string = ""
+        if fragment_id:
+            request.fragment_id = fragment_id
+        for widget_id, value in self.widgets.items():
+            state = request.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = value
+
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await self.ws.recv())
+            kind = reply.WhichOneof("type")
+            if kind == "script_finished":
+                return (time.perf_counter() - start) * 1000
+            if kind == "delta":
+                self._discover(reply.delta)
+
+    def _discover(self, delta):
+        """Remember the ids of the widgets the script drives."""
+        kind = delta.WhichOneof("type")
+        if kind == "new_element" and delta.new_element.WhichOneof("type") == "radio":
+            radio = delta.new_element.radio
+            if radio.id.endswith("-theme_choice"):
+                self.theme_id = radio.id
+                self.theme_fragment = delta.fragment_id
+        elif kind == "add_block":
+            block = delta.add_block
+            if block.WhichOneof("type") == "tab_container" and block.tab_container.id:
+                if block.tab_container.id != self.tab_id:
+                    self.tab_id = block.tab_container.id
+                    self.tab_labels = []
+            elif block.WhichOneof("type") == "tab" and len(self.tab_labels) < 16:
+                if block.tab.label not in self.tab_labels:
+                    self.tab_labels.append(block.tab.label)
+
+    async def toggle_theme(self) -> float:
+        self.theme = "Dark" if self.theme == "Light" else "Light"
+        self.widgets[self.theme_id] = self.theme
+        return await self.rerun(self.theme_fragment)
+
+    async def switch_tab(self) -> float:
+        self.tab = (self.tab + 1) % len(self.tab_labels)
+        self.widgets[self.tab_id] = self.tab_labels[self.tab]
+        return await self.rerun()
+
+    async def play(self, steps: int, think: float) -> list:
+        latencies = []
+        for step in range(steps):
+            action = self.toggle_theme if step % 2 == 0 else self.switch_tab
+            latencies.append(await action())
+            if think:
+                await asyncio.sleep(think)
+        return latencies
+
+
+async def sample_rss(pid: int, peak: list, interval: float = 0.1):
+    while True:
+        value = rss_kb(pid)
+        if value is not None:
+            peak[0] = max(peak[0], value)
+        await asyncio.sleep(interval)
+
+
+async def run_level(url: str, pid: int, sessions: int, steps: int, think: float, idle_kb) -> dict:
+    peak = [0]
+    sampler = asyncio.create_task(sample_rss(pid, peak))
+    clients = [Session(url) for _ in range(sessions)]
+    try:
+        connect = await asyncio.gather(*(client.open() for client in clients))
+        missing = [client for client in clients if not (client.theme_id and client.tab_labels)]
+        if missing:
+            raise RuntimeError("theme radio or tabs not found; is the app running with THEME_MODE=server?")
+        start = time.perf_counter()
+        played = await asyncio.gather(*(client.play(steps, think) for client in clients))
+        elapsed = time.perf_counter() - start
+    finally:
+        sampler.cancel()
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+    latencies = [value for session in played for value in session]
+    result = {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "connect_p95_ms": percentile(connect, 0.95),
+        "reruns_per_s": len(latencies) / elapsed,
+    }
+    if idle_kb is not None and peak[0]:
+        result["rss_kb"] = peak[0]
+        result["rss_per_session_kb"] = max(0, peak[0] - idle_kb) / sessions
+    return {metric: round(value, 3) for metric, value in result.items()}
+
+
+async def run_suite(port: int, pid: int, levels, steps: int, think: float) -> dict:
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    # One throwaway session warms the process caches so the first level does
+    # not pay for them; idle RSS is taken once it has closed.
+    await run_level(url, pid, 1, 2, 0, None)
+    await asyncio.sleep(1)
+    idle_kb = rss_kb(pid)
+
+    results = {}
+    for sessions in levels:
+        results[f"sessions_{sessions}"] = level = await run_level(url, pid, sessions, steps, think, idle_kb)
+        memory = f"  rss/session={level['rss_per_session_kb']:.0f}KB" if "rss_per_session_kb" in level else ""
+        print(
+            f"N={sessions:<4d} p50={level['p50_ms']:.1f}ms  p95={level['p95_ms']:.1f}ms  "
+            f"p99={level['p99_ms']:.1f}ms  {level['reruns_per_s']:.1f} reruns/s{memory}"
+        )
+    return {"idle_rss_kb": idle_kb, "levels": results}
+
+
+def find_knee(levels: dict, factor: float):
+    """First session count whose p95 exceeds ``factor`` times the first level's."""
+    ordered = sorted(levels.items(), key=lambda item: int(item[0].split("_")[1]))
+    floor = ordered[0][1]["p95_ms"]
+    for name, level in ordered[1:]:
+        if level["p95_ms"] > floor * factor:
+            return int(name.split("_")[1])
+    return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25], help="concurrent session counts")
+    parser.add_argument("--steps", type=int, default=10, help="scripted reruns per session and level")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds each session waits between reruns")
+    parser.add_argument("--port", type=int, help="port for the app (default: a free one)")
+    parser.add_argument("--knee-factor", type=float, default=3.0, help="p95 growth that marks the knee")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/load-<git rev>.json)")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="allowed regression as a fraction")
+    args = parser.parse_args(argv)
+
+    port = args.port or free_port()
+    server = start_server(port)
+    try:
+        results = asyncio.run(run_suite(port, server.pid, sorted(set(args.sessions)), args.steps, args.think))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    knee = find_knee(results["levels"], args.knee_factor)
+    print(f"knee: {knee} sessions" if knee else "knee: not reached")
+    revision = git_revision()
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"revision": revision, "steps": args.steps, "think": args.think, "knee": knee, **results}, f, indent=2)
+        f.write("\n")
+    print(f"results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["levels"]
+        current = {
+            name: {metric: value for metric, value in level.items() if metric in COMPARED}
+            for name, level in results["levels"].items()
+        }
+        regressions = compare(current, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""Contact form delivery for the portfolio, used by My_Cv.py.
+
+Submissions are committed to a SQLite outbox and delivered by a background
+worker through one backend: "smtp" (CONTACT_SMTP_*), "webhook" (JSON POST
+to CONTACT_WEBHOOK_URL) or "file" (one .eml per message in
+CONTACT_OUTBOX_DIR). Failed deliveries are retried after
+CONTACT_RETRY_BASE * 2**attempt seconds (jittered, at most
+CONTACT_RETRY_MAX) until CONTACT_MAX_ATTEMPTS.
+"""
+import json
+import os
+import random
+import re
+import smtplib
+import sqlite3
+import ssl
+import threading
+import time
+from email.errors import HeaderParseError
+from email.headerregistry import Address
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from urllib.request import Request, urlopen
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CONTACT_BACKEND = os.environ.get("CONTACT_BACKEND", "file")
+CONTACT_QUEUE_DB = os.path.join(APP_DIR, os.environ.get("CONTACT_QUEUE_DB", os.path.join("build", "contact.sqlite3")))
+CONTACT_OUTBOX_DIR = os.path.join(APP_DIR, os.environ.get("CONTACT_OUTBOX_DIR", os.path.join("build", "outbox")))
+CONTACT_FROM = os.environ.get("CONTACT_FROM", "portfolio@localhost")
+CONTACT_SMTP_HOST = os.environ.get("CONTACT_SMTP_HOST", "localhost")
+CONTACT_SMTP_PORT = int(os.environ.get("CONTACT_SMTP_PORT", 25))
+CONTACT_SMTP_SECURITY = os.environ.get("CONTACT_SMTP_SECURITY", "none")  # "none", "starttls" or "ssl"
+CONTACT_SMTP_USER = os.environ.get("CONTACT_SMTP_USER", "")
+CONTACT_SMTP_PASSWORD = os.environ.get("CONTACT_SMTP_PASSWORD", "")
+CONTACT_WEBHOOK_URL = os.environ.get("CONTACT_WEBHOOK_URL", "")
+CONTACT_TIMEOUT = 10
+CONTACT_MAX_ATTEMPTS = int(os.environ.get("CONTACT_MAX_ATTEMPTS", 8))
+CONTACT_RETRY_BASE = float(os.environ.get("CONTACT_RETRY_BASE", 30))
+CONTACT_RETRY_MAX = 3600
+
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def sender_address(name: str, email: str):
+    """The sender as one quoted Reply-To address, or None if it can't be one."""
+    try:
+        return Address(display_name=name, addr_spec=email)
+    except (ValueError, IndexError, HeaderParseError):
+        return None
+
+
+def valid_contact(name: str, email: str, message: str) -> bool:
+    return (
+        0 < len(name) <= 100 and len(email) <= 254 and bool(EMAIL_RE.fullmatch(email))
+        and sender_address(name, email) is not None and 10 <= len(message) <= 5000
+    )
+
+
+def contact_email(submission: dict, sender: str = CONTACT_FROM) -> EmailMessage:
+    """The submission as an email to its recipient, replying to the sender."""
+    mail = EmailMessage()
+    mail["From"] = sender
+    mail["To"] = submission["recipient"]
+    # Quoted by Address, so a name like "Eve, eve@evil.test" stays one
+    # address. Messages queued before validation checked it go without one.
+    reply_to = sender_address(submission["name"], submission["email"])
+    if reply_to:
+        mail["Reply-To"] = reply_to
+    mail["Subject"] = f'Portfolio message from {submission["name"]}'
+    mail["Date"] = formatdate(submission["created"], localtime=False)
+    mail["Message-ID"] = make_msgid(idstring=f'contact-{submission["id"]}')
+    mail.set_content(submission["message"])
+    return mail
+
+
+class SmtpBackend:
+    """Sends each message through an SMTP server."""
+
+    def __init__(self, host: str = CONTACT_SMTP_HOST, port: int = CONTACT_SMTP_PORT,
+                 security: str = CONTACT_SMTP_SECURITY, user: str = CONTACT_SMTP_USER,
+                 password: str = CONTACT_SMTP_PASSWORD, timeout: float = CONTACT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.security = security
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+
+    def deliver(self, submission: dict):
+        if self.security == "ssl":
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        with server:
+            if self.security == "starttls":
+                server.starttls(context=ssl.create_default_context())
+            if self.user:
+                server.login(self.user, self.password)
+            server.send_message(contact_email(submission))
+
+
+class WebhookBackend:
+    """POSTs each message as JSON; any non-2xx answer counts as a failure."""
+
+    def __init__(self, url: str = CONTACT_WEBHOOK_URL, timeout: float = CONTACT_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, submission: dict):
+        if not self.url:
+            raise RuntimeError("CONTACT_WEBHOOK_URL is not set")
+        body = json.dumps({key: submission[key] for key in ("id", "name", "email", "message", "recipient", "profile", "created")})
+        request = Request(self.url, body.encode("utf-8"), {"Content-Type": "application/json"})
+        with urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise RuntimeError(f"HTTP {response.status}")
+
+
+class FileBackend:
+    """Writes each message as an .eml file into ``outbox_dir``."""
+
+    def __init__(self, outbox_dir: str = CONTACT_OUTBOX_DIR):
+        self.outbox_dir = outbox_dir
+
+    def deliver(self, submission: dict):
+        os.makedirs(self.outbox_dir, exist_ok=True)
+        path = os.path.join(self.outbox_dir, f'contact-{submission["id"]:06d}.eml')
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(contact_email(submission).as_bytes())
+        os.replace(tmp, path)
+
+
+BACKENDS = {"smtp": SmtpBackend, "webhook": WebhookBackend, "file": FileBackend}
+
+
+def contact_backend(name: str):
+    """The backend called ``name``; ValueError if there is none."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown CONTACT_BACKEND '{name}' (expected one of: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+class ContactQueue:
+    """Durable outbox of contact messages with a background delivery worker.
+
+    ``submit`` only commits a row to SQLite, so the form returns at once
+    and a message survives a restart. The worker delivers due messages
+    through ``backend``; a failure is retried after an exponentially growing,
+    jittered delay, and after ``max_attempts`` the message is marked failed.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created REAL NOT NULL,
+        profile TEXT NOT NULL,
+        recipient TEXT NOT NULL,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        message TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt REAL NOT NULL,
+        last_error TEXT NOT NULL DEFAULT '',
+        sent REAL
+    );
+    CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt);
+    """
+
+    def __init__(self, db_path: str, backend, max_attempts: int = CONTACT_MAX_ATTEMPTS,
+                 retry_base: float = CONTACT_RETRY_BASE, retry_max: float = CONTACT_RETRY_MAX):
+        self.db_path = db_path
+        self.backend = backend
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._wake = threading.Event()
+        self._lock = threading.Lock()  # one delivery pass at a time
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(self.SCHEMA)
+        return connection
+
+    def start(self):
+        """Start the worker; it also picks up messages left by an earlier process."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="contact-delivery", daemon=True)
+                self._thread.start()
+
+    def submit(self, profile: str, recipient: str, name: str, email: str, message: str) -> int:
+        """Store a message for delivery and return its id; never touches the network."""
+        now = time.time()
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO messages (created, profile, recipient, name, email, message, next_attempt) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (now, profile, recipient, name, email, message, now),
+                )
+        finally:
+            connection.close()
+        self._wake.set()  # the worker, if started, delivers it now
+        return cursor.lastrowid
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds before attempt ``attempts + 1``: exponential with jitter."""
+        return min(self.retry_max, self.retry_base * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+
+    def deliver_due(self, due_by: float = None) -> int:
+        """Try every pending message due by ``due_by`` (default: now); returns how many were delivered."""
+        delivered = 0
+        with self._lock:
+            connection = self._connect()
+            try:
+                due = connection.execute(
+                    "SELECT * FROM messages WHERE status = 'pending' AND next_attempt <= ? ORDER BY id",
+                    (time.time() if due_by is None else due_by,),
+                ).fetchall()
+                for row in due:
+                    submission = dict(row)
+                    try:
+                        self.backend.deliver(submission)
+                    except Exception as e:
+                        attempts = row["attempts"] + 1
+                        status = "failed" if attempts >= self.max_attempts else "pending"
+                        with connection:
+                            connection.execute(
+                                "UPDATE messages SET status = ?, attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                                (status, attempts, time.time() + self.retry_delay(attempts), f"{type(e).__name__}: {e}"[:500], row["id"]),
+                            )
+                        print(f"Error delivering contact message {row['id']} (attempt {attempts}): {e}")
+                        continue
+                    with connection:
+                        connection.execute(
+                            "UPDATE messages SET status = 'sent', attempts = attempts + 1, sent = ?, last_error = '' WHERE id = ?",
+                            (time.time(), row["id"]),
+                        )
+                    delivered += 1
+            finally:
+                connection.close()
+        return delivered
+
+    def next_due(self):
+        """Seconds until the next pending message is due, or None if none is."""
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT MIN(next_attempt) FROM messages WHERE status = 'pending'").fetchone()
+        finally:
+            connection.close()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def _run(self):
+        while True:
+            try:
+                self.deliver_due()
+                wait = self.next_due()
+            except sqlite3.Error as e:
+                print(f"Error reading the contact queue: {e}")
+                wait = 60
+            self._wake.wait(60 if wait is None else min(wait, 60))
+            self._wake.clear()
+
+    def requeue_failed(self) -> int:
+        """Give every failed message a fresh set of attempts; returns how many."""
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(
+                    "UPDATE messages SET status = 'pending', attempts = 0, next_attempt = ? WHERE status = 'failed'",
+                    (time.time(),),
+                ).rowcount
+        finally:
+            connection.close()
+
+    def stats(self) -> dict:
+        """Message counts by status."""
+        connection = self._connect()
+        try:
+            return dict(connection.execute("SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall())
+        finally:
+            connection.close()
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def get_queue(db_path: str = CONTACT_QUEUE_DB, backend_name: str = CONTACT_BACKEND):
+    """The process-wide, started queue for ``db_path``, or None if ``backend_name`` is unknown.
+
+    The name is checked once per process: a mistyped CONTACT_BACKEND prints
+    one warning and leaves the form disabled instead of failing every page.
+    """
+    with _queues_lock:
+        if db_path not in _queues:
+            try:
+                queue = ContactQueue(db_path, contact_backend(backend_name))
+            except ValueError as e:
+                print(f"Warning: contact form disabled: {e}")
+                queue = None
+            else:
+                queue.start()
+            _queues[db_path] = queue
+        return _queues[db_path]
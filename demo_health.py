@@ -0,0 +1,135 @@
+"""Health checks of the featured projects' demo links, used by My_Cv.py.
+
+Each link is fetched with asyncio streams and classified as "up",
+"sleeping" (Streamlit Community Cloud's page for an app put to sleep) or
+"down". DemoHealthChecker runs the probes in a background thread and
+reuses results for DEMO_HEALTH_TTL seconds, so a page render never waits
+on the network.
+"""
+import asyncio
+import os
+import re
+import ssl
+import threading
+import time
+from urllib.parse import urljoin, urlsplit
+
+DEMO_HEALTH_TTL = float(os.environ.get("DEMO_HEALTH_TTL", 300))
+DEMO_HEALTH_TIMEOUT = float(os.environ.get("DEMO_HEALTH_TIMEOUT", 8))
+# Text of Streamlit Community Cloud's page for an app put to sleep.
+DEMO_SLEEP_MARKERS = ("gone to sleep", "get this app back up")
+
+
+async def fetch_page(url: str, max_bytes: int = 65536, redirects: int = 3):
+    """GET ``url`` with asyncio streams; returns (status, first bytes of body).
+
+    Follows up to ``redirects`` redirects. Raises OSError or ValueError when
+    the server can't be reached or doesn't speak HTTP.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"not an http(s) URL: {url}")
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, port, ssl=ssl.create_default_context() if secure else None
+    )
+    try:
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\nUser-Agent: portfolio-health/1\r\n"
+            f"Accept: text/html\r\nConnection: close\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+        status_line = (await reader.readline()).decode("latin-1")
+        match = re.match(r"HTTP/\d(?:\.\d)? (\d{3})", status_line)
+        if not match:
+            raise ValueError(f"bad status line from {parts.netloc}: {status_line.strip()!r}")
+        status = int(match.group(1))
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if 300 <= status < 400 and "location" in headers and redirects > 0:
+            return await fetch_page(urljoin(url, headers["location"]), max_bytes, redirects - 1)
+        body = await reader.read(max_bytes)
+        return status, body.decode("utf-8", "replace")
+    finally:
+        writer.close()
+
+
+class DemoHealthChecker:
+    """Background health checks of demo URLs with a TTL cache.
+
+    ``get`` never waits on the network: it returns the cached status of
+    each URL (None until first checked) and, when any are missing or older
+    than ``ttl`` seconds, starts one background thread that probes all of
+    them concurrently with asyncio.
+    """
+
+    def __init__(self, ttl: float = DEMO_HEALTH_TTL, timeout: float = DEMO_HEALTH_TIMEOUT):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._results = {}  # url -> {"status", "latency_ms", "detail", "checked_at"}
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.refreshes = 0
+
+    def get(self, urls) -> dict:
+        """Cached status of each URL, refreshing stale ones in the background."""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                url for url in urls
+                if url not in self._results or now - self._results[url]["checked_at"] > self.ttl
+            ]
+            if stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, args=(stale,), name="demo-health", daemon=True).start()
+            return {url: self._results.get(url) for url in urls}
+
+    def _refresh(self, urls):
+        try:
+            results = asyncio.run(self.check_all(urls))
+            with self._lock:
+                self._results.update(results)
+                self.refreshes += 1
+        except Exception as e:
+            print(f"Error checking demo health: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    async def check_all(self, urls) -> dict:
+        """Probe every URL concurrently."""
+        results = await asyncio.gather(*(self.check(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def check(self, url: str) -> dict:
+        """Classify one URL as "up", "sleeping" or "down"."""
+        start = time.perf_counter()
+        try:
+            status, body = await asyncio.wait_for(fetch_page(url), self.timeout)
+        except asyncio.TimeoutError:
+            state, detail = "down", f"no response in {self.timeout:g} s"
+        except (OSError, ValueError) as e:
+            state, detail = "down", str(e) or type(e).__name__
+        else:
+            text = body.lower()
+            if any(marker in text for marker in DEMO_SLEEP_MARKERS):
+                state, detail = "sleeping", f"HTTP {status}"
+            elif status < 300:
+                state, detail = "up", f"HTTP {status}"
+            elif status < 400:  # a redirect fetch_page didn't follow
+                state, detail = "down", f"HTTP {status}: too many redirects or no Location"
+            else:
+                state, detail = "down", f"HTTP {status}"
+        return {
+            "status": state,
+            "latency_ms": round((time.perf_counter() - start) * 1000),
+            "detail": detail,
+            "checked_at": time.monotonic(),
+        }
@@ -0,0 +1,89 @@
+"""Entry point that serves My_Cv.py plus its fingerprinted assets.
+
+    streamlit run serve.py
+
+Runs the portfolio as usual and adds an /assets/ route for the files
+My_Cv.py publishes to static/assets under content-hashed names. Their
+bytes never change, so they are sent with a one-year immutable
+Cache-Control, and a precompressed .br or .gz copy is sent instead when
+the browser accepts it.
+
+It also takes the <a ping> beacons the page puts on its CV and demo
+links at /events/ and queues them as analytics events.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import parse_qs, urlsplit
+
+# Read by My_Cv.py on every run; it links assets under /assets/ instead of
+# Streamlit's static folder.
+os.environ["ASSET_ROUTE"] = "1"
+
+import streamlit as st
+import analytics
+from starlette.responses import FileResponse, Response
+from starlette.routing import Route
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(APP_DIR, "static", "assets")
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Preferred first; suffixes match AssetManifest.SUFFIXES in My_Cv.py.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Only published copies (name.<10 hex digits>.ext), never the manifest.
+ASSET_NAME_RE = re.compile(r"[\w-]+(?:\.[\w-]+)*\.[0-9a-f]{10}\.[a-z0-9]+")
+
+
+def accepted_encodings(header: str) -> set:
+    """Codings the Accept-Encoding header allows (q=0 excluded)."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and not re.fullmatch(r"\s*q\s*=\s*0(\.0*)?\s*", params):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+async def asset(request):
+    name = request.path_params["name"]
+    path = os.path.join(ASSETS_DIR, name)
+    if not ASSET_NAME_RE.fullmatch(name) or not os.path.isfile(path):
+        return Response("Not found", status_code=404)
+
+    headers = {"Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding", "X-Content-Type-Options": "nosniff"}
+    media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted and os.path.isfile(path + suffix):
+            path, headers["Content-Encoding"] = path + suffix, encoding
+            break
+    # The name already carries the content hash, so it makes a strong ETag.
+    headers["ETag"] = f'"{os.path.basename(path)}"'
+    if headers["ETag"] in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+# Link clicks reported by ping; the other kinds are recorded by the script.
+PING_KINDS = ("cv_downloaded", "demo_clicked")
+
+
+async def event(request):
+    """Queue a ping beacon; Ping-To is the link followed, Ping-From the page."""
+    kind = request.path_params["kind"]
+    if kind not in PING_KINDS:
+        return Response(status_code=404)
+    if os.environ.get("ANALYTICS", "1") != "0":
+        page = parse_qs(urlsplit(request.headers.get("ping-from", "")).query)
+        profile = page.get("profile", [""])[0]
+        analytics.get_writer().record(kind, profile=profile, detail=request.headers.get("ping-to", ""))
+    return Response(status_code=204)
+
+
+app = st.App(
+    os.path.join(APP_DIR, "My_Cv.py"),
+    routes=[
+        Route("/assets/{name}", asset, methods=["GET", "HEAD"]),
+        Route("/events/{kind}", event, methods=["POST"]),
+    ],
+)
@@ -0,0 +1,189 @@
+"""contact.py against a local SMTP sink and a local webhook."""
+import json
+import socketserver
+import threading
+from email import message_from_bytes
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import contact
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server: answers 451 to the first ``fail`` messages, then accepts."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, fail: int = 0):
+        super().__init__(("127.0.0.1", 0), SmtpHandler)
+        self.fail = fail
+        self.attempts = 0
+        self.messages = []
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        self.reply("220 sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").strip().upper()
+            if command.startswith("EHLO") or command.startswith("HELO"):
+                self.reply("250 sink")
+            elif command.startswith("DATA"):
+                self.reply("354 end with <CRLF>.<CRLF>")
+                data = b""
+                while (line := self.rfile.readline()) != b".\r\n":
+                    data += line[1:] if line.startswith(b"..") else line
+                self.server.attempts += 1
+                if self.server.attempts <= self.server.fail:
+                    self.reply("451 try again later")
+                else:
+                    self.server.messages.append(message_from_bytes(data))
+                    self.reply("250 queued")
+            elif command.startswith("QUIT"):
+                self.reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self.reply("250 ok")
+
+
+@pytest.fixture
+def smtp_sink():
+    servers = []
+
+    def start(fail: int = 0) -> SmtpSink:
+        server = SmtpSink(fail)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(json.loads(body))
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    server.status = 204
+    server.received = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def submit(queue: contact.ContactQueue, name: str = "Ada Lovelace") -> int:
+    return queue.submit("default", "owner@example.com", name, "ada@example.com", "Hello from the test suite.")
+
+
+def test_smtp_retries_with_backoff_then_delivers(tmp_path, smtp_sink):
+    sink = smtp_sink(fail=2)
+    queue = contact.ContactQueue(str(tmp_path / "queue.sqlite3"), contact.SmtpBackend("127.0.0.1", sink.server_address[1]),
+                                 max_attempts=5, retry_base=30, retry_max=3600)
+    message_id = submit(queue, name="Eve, eve@evil.test")
+
+    assert queue.deliver_due() == 0
+    first_wait = queue.next_due()
+    assert 14 <= first_wait <= 30  # retry_base * 2**0, jittered down to half
+    assert queue.deliver_due() == 0  # not due yet: nothing is attempted
+    assert sink.attempts == 1
+
+    assert queue.deliver_due(float("inf")) == 0
+    assert 29 <= queue.next_due() <= 60  # doubled
+    assert queue.deliver_due(float("inf")) == 1
+    assert sink.attempts == 3
+    assert queue.stats() == {"sent": 1}
+    assert queue.next_due() is None
+
+    [mail] = sink.messages
+    assert mail["To"] == "owner@example.com"
+    assert mail["Reply-To"] == '"Eve, eve@evil.test" <ada@example.com>'
+    assert f".contact-{message_id}@" in mail["Message-ID"]
+
+
+def test_smtp_gives_up_after_max_attempts(tmp_path, smtp_sink):
+    sink = smtp_sink(fail=10)
+    queue = contact.ContactQueue(str(tmp_path / "queue.sqlite3"), contact.SmtpBackend("127.0.0.1", sink.server_address[1]),
+                                 max_attempts=3)
+    submit(queue)
+    for _ in range(5):
+        queue.deliver_due(float("inf"))
+    assert sink.attempts == 3
+    assert queue.stats() == {"failed": 1}
+
+    sink.fail = 0
+    assert queue.requeue_failed() == 1
+    assert queue.deliver_due() == 1
+    assert len(sink.messages) == 1
+
+
+def test_retry_delay_is_capped(tmp_path):
+    queue = contact.ContactQueue(str(tmp_path / "queue.sqlite3"), None, retry_base=30, retry_max=3600)
+    for attempts in range(1, 12):
+        expected = min(3600, 30 * 2 ** (attempts - 1))
+        assert expected / 2 <= queue.retry_delay(attempts) <= expected
+
+
+def test_webhook_delivers_json_and_retries_errors(tmp_path, webhook):
+    url = f"http://127.0.0.1:{webhook.server_address[1]}/contact"
+    queue = contact.ContactQueue(str(tmp_path / "queue.sqlite3"), contact.WebhookBackend(url))
+    webhook.status = 500
+    submit(queue)
+    assert queue.deliver_due() == 0
+    assert queue.stats() == {"pending": 1}
+
+    webhook.status = 204
+    assert queue.deliver_due(float("inf")) == 1
+    assert webhook.received[-1]["recipient"] == "owner@example.com"
+    assert webhook.received[-1]["name"] == "Ada Lovelace"
+
+
+def test_file_backend_writes_eml(tmp_path):
+    outbox = tmp_path / "outbox"
+    queue = contact.ContactQueue(str(tmp_path / "queue.sqlite3"), contact.FileBackend(str(outbox)))
+    message_id = submit(queue)
+    assert queue.deliver_due() == 1
+    mail = message_from_bytes((outbox / f"contact-{message_id:06d}.eml").read_bytes())
+    assert mail["Subject"] == "Portfolio message from Ada Lovelace"
+    assert [path.name for path in outbox.iterdir()] == [f"contact-{message_id:06d}.eml"]
+
+
+def test_unknown_backend_disables_the_queue_once(tmp_path, capsys):
+    db_path = str(tmp_path / "queue.sqlite3")
+    assert contact.get_queue(db_path, "smpt") is None
+    assert contact.get_queue(db_path, "smpt") is None
+    assert capsys.readouterr().out.count("contact form disabled") == 1
+    with pytest.raises(ValueError):
+        contact.contact_backend("smpt")
+
+
+@pytest.mark.parametrize("name, email, valid", [
+    ("Ada", "ada@example.com", True),
+    ("Eve, eve@evil.test", "ada@example.com", True),
+    ("", "ada@example.com", False),
+    ("Ada", "not-an-address", False),
+    ("Ada\r\nBcc: x@evil.test", "ada@example.com", False),
+])
+def test_valid_contact(name, email, valid):
+    assert contact.valid_contact(name, email, "A message long enough.") is valid
@@ -0,0 +1,96 @@
+"""demo_health.py against a local HTTP stand-in for the demo apps."""
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import demo_health
+
+PAGES = {
+    "/up": (200, {}, "<html>Fraud detection demo</html>"),
+    "/sleeping": (200, {}, "<html>Zzzz. This app has gone to sleep due to inactivity.</html>"),
+    "/down": (503, {}, "<html>Service Unavailable</html>"),
+    "/redirect": (302, {"Location": "/sleeping"}, ""),
+    "/redirect-up": (301, {"Location": "http://{host}/up"}, ""),
+    "/loop": (302, {"Location": "/loop"}, ""),
+}
+
+
+class DemoHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/slow":
+            self.server.release.wait(5)
+        status, headers, body = PAGES.get(self.path, (404, {}, "not found"))
+        data = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value.format(host=self.headers["Host"]))
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def demo_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DemoHandler)
+    server.release = threading.Event()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def check(url: str, timeout: float = 2) -> dict:
+    return asyncio.run(demo_health.DemoHealthChecker(ttl=60, timeout=timeout).check(url))
+
+
+@pytest.mark.parametrize("path, status, detail", [
+    ("/up", "up", "HTTP 200"),
+    ("/sleeping", "sleeping", "HTTP 200"),
+    ("/down", "down", "HTTP 503"),
+    ("/redirect", "sleeping", "HTTP 200"),
+    ("/redirect-up", "up", "HTTP 200"),
+    ("/loop", "down", "HTTP 302: too many redirects or no Location"),
+    ("/missing", "down", "HTTP 404"),
+])
+def test_classification(demo_server, path, status, detail):
+    result = check(demo_server + path)
+    assert (result["status"], result["detail"]) == (status, detail)
+
+
+def test_timeout_is_down(demo_server):
+    start = time.perf_counter()
+    result = check(demo_server + "/slow", timeout=0.3)
+    assert result["status"] == "down"
+    assert result["detail"] == "no response in 0.3 s"
+    assert time.perf_counter() - start < 2
+
+
+def test_refused_connection_is_down():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    assert check(f"http://127.0.0.1:{port}/")["status"] == "down"
+
+
+def test_not_http_is_down():
+    assert check("ftp://example.com/")["status"] == "down"
+
+
+def test_get_refreshes_in_background_and_caches(demo_server):
+    checker = demo_health.DemoHealthChecker(ttl=60, timeout=2)
+    urls = [demo_server + "/up", demo_server + "/down"]
+    assert checker.get(urls) == {url: None for url in urls}  # never waits on the network
+    deadline = time.monotonic() + 5
+    while checker.refreshes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    results = checker.get(urls)
+    assert [results[url]["status"] for url in urls] == ["up", "down"]
+    assert checker.refreshes == 1  # still fresh: no second probe